@@ -9,36 +9,128 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 import json
+import mimetypes
 import secrets
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 from flask import Flask, render_template, request, jsonify, session, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from functools import wraps
 
 from engine import (
-    GameState, create_character, create_enemy_from_llm, Enemy,
+    GameState, create_character, create_enemy_from_llm,
     player_attack, enemy_attack, use_class_ability, attempt_flee,
     check_combat_end, skill_check, use_item, save_game, load_game,
     format_stats, format_inventory, format_quests, CLASSES, dice
 )
 from llm_dm import DungeonMaster, AVAILABLE_MODELS, DEFAULT_MODEL, check_api_key
-from image_gen import generate_scene_image, generate_enemy_image
+from image_gen import generate_scene_image, generate_enemy_image, prewarm_image
 
 # =============================================================================
 # APP CONFIGURATION
 # =============================================================================
 
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson for faster API responses."""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 # Check if React frontend is built
 REACT_BUILD_PATH = os.path.join(os.path.dirname(__file__), 'frontend', 'dist')
 USE_REACT = os.path.exists(REACT_BUILD_PATH)
 
+# Index the build once at boot so serving a file needs no filesystem checks
+REACT_FILES = frozenset(
+    os.path.relpath(os.path.join(root, name), REACT_BUILD_PATH).replace(os.sep, '/')
+    for root, _, names in os.walk(REACT_BUILD_PATH)
+    for name in names
+) if USE_REACT else frozenset()
+
+# Vite content-hashes everything under assets/, so those files never change
+ASSET_MAX_AGE = 31536000  # One year
+
 if USE_REACT:
-    app = Flask(__name__, static_folder=os.path.join(REACT_BUILD_PATH, 'assets'), static_url_path='/assets')
+    # serve_react handles the build (including assets/) itself
+    app = Flask(__name__, static_folder=None)
 else:
     app = Flask(__name__)
     
-app.secret_key = os.environ.get('FLASK_SECRET_KEY', secrets.token_hex(32))
+app.json = ORJSONProvider(app)
+
+# Every worker must sign cookies with the same key or players lose their game
+# whenever a request lands on a different worker. Only local dev (python app.py
+# or FLASK_DEBUG) may fall back to a throwaway key. The env.example.txt
+# placeholder is public, so it counts as unset.
+SECRET_KEY = os.environ.get('FLASK_SECRET_KEY')
+if SECRET_KEY == 'your-secret-key-here':
+    SECRET_KEY = None
+if not SECRET_KEY:
+    if __name__ != '__main__' and os.environ.get('FLASK_DEBUG', 'false').lower() != 'true':
+        raise RuntimeError("FLASK_SECRET_KEY must be set when running in production")
+    SECRET_KEY = secrets.token_hex(32)
+app.secret_key = SECRET_KEY
+
+# =============================================================================
+# SESSION STORE
+# =============================================================================
+
+# Game sessions live in Redis when REDIS_URL is set, so every gunicorn worker
+# sees the same games. Without it we fall back to an in-process dict (local dev).
+REDIS_URL = os.environ.get('REDIS_URL')
+SESSION_TTL = 3600  # Seconds before an abandoned game is evicted
+MAX_LOCAL_SESSIONS = 10_000  # Cap on in-process games when Redis is off
+
+if REDIS_URL:
+    import redis
+    import msgpack
+    redis_pool = redis.ConnectionPool.from_url(REDIS_URL)
+    redis_client = redis.Redis(connection_pool=redis_pool)
+else:
+    redis_client = None
+
+class SessionCache:
+    """Thread-safe LRU of game states; the TTL restarts on every write, like SETEX."""
+    
+    def __init__(self, maxsize: int, ttl: int):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # session_id -> (expires_at, state)
+        self._lock = threading.RLock()
+    
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[0] < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return entry[1]
+    
+    def __setitem__(self, key, state):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, state)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+# Store active game sessions (local dev only - production uses Redis)
+game_sessions = SessionCache(MAX_LOCAL_SESSIONS, SESSION_TTL)
+
+# One template for every scene image so revisited locations hit the image cache
+SCENE_IMAGE_PROMPT = "dark fantasy {scene}, moody lighting, medieval, atmospheric fog, dramatic shadows, cinematic"
 
-# Store active game sessions (in production, use Redis or database)
-game_sessions = {}
+# Image URLs are built locally in microseconds; the only slow image work is
+# warming Pollinations renders, which can take many seconds, so that runs here
+prewarm_executor = ThreadPoolExecutor(max_workers=4)
 
 def get_dm():
     """Get or create DungeonMaster instance."""
@@ -49,15 +141,34 @@ def get_dm():
 def get_game_state():
     """Get current game state from session."""
     session_id = session.get('session_id')
-    if session_id and session_id in game_sessions:
-        return game_sessions[session_id]
-    return None
+    if not session_id:
+        return None
+    if redis_client is not None:
+        blob = redis_client.get(f"game:{session_id}")
+        if blob is None:
+            return None
+        return GameState.from_dict(msgpack.unpackb(blob))
+    return game_sessions.get(session_id)
 
 def set_game_state(state):
     """Store game state in session."""
     if 'session_id' not in session:
         session['session_id'] = secrets.token_hex(16)
-    game_sessions[session['session_id']] = state
+    session_id = session['session_id']
+    if redis_client is not None:
+        blob = msgpack.packb(state.to_dict())
+        redis_client.setex(f"game:{session_id}", SESSION_TTL, blob)
+    else:
+        game_sessions[session_id] = state
+
+def read_only_session(view):
+    """Mark a view as never changing the session so Flask skips re-signing the cookie."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        response = view(*args, **kwargs)
+        session.modified = False
+        return response
+    return wrapper
 
 # =============================================================================
 # ROUTES - PAGES
@@ -67,7 +178,7 @@ def set_game_state(state):
 def index():
     """Main game page."""
     if USE_REACT:
-        return send_from_directory(REACT_BUILD_PATH, 'index.html')
+        return send_react_file('index.html')
     else:
         has_key, _ = check_api_key()
         models = [(k, v['name'], v['description']) for k, v in AVAILABLE_MODELS.items()]
@@ -82,18 +193,35 @@ def serve_react(path):
     """Serve React app static files or fallback to index.html."""
     if USE_REACT:
         # Try to serve static file first
-        file_path = os.path.join(REACT_BUILD_PATH, path)
-        if os.path.exists(file_path) and os.path.isfile(file_path):
-            return send_from_directory(REACT_BUILD_PATH, path)
+        if path in REACT_FILES:
+            return send_react_file(path)
         # Fallback to index.html for SPA routing
-        return send_from_directory(REACT_BUILD_PATH, 'index.html')
+        return send_react_file('index.html')
     return "Not found", 404
 
+def send_react_file(path):
+    """Send a file from the React build, preferring a precompressed .br/.gz copy."""
+    max_age = ASSET_MAX_AGE if path.startswith('assets/') else 0
+    accepted = request.headers.get('Accept-Encoding', '')
+    for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+        if encoding in accepted and path + suffix in REACT_FILES:
+            response = send_from_directory(
+                REACT_BUILD_PATH, path + suffix,
+                max_age=max_age, mimetype=mimetypes.guess_type(path)[0]
+            )
+            response.headers['Content-Encoding'] = encoding
+            response.vary.add('Accept-Encoding')
+            return response
+    response = send_from_directory(REACT_BUILD_PATH, path, max_age=max_age)
+    response.vary.add('Accept-Encoding')
+    return response
+
 # =============================================================================
 # ROUTES - API
 # =============================================================================
 
 @app.route('/api/status')
+@read_only_session
 def api_status():
     """Check API and game status."""
     has_key, msg = check_api_key()
@@ -105,14 +233,18 @@ def api_status():
         'game_started': state.game_started if state else False
     })
 
+# AVAILABLE_MODELS is fixed at import time, so build the public list once
+MODEL_LIST = tuple(
+    {'id': k, 'name': v['name'], 'description': v['description'], 'tier': v['tier']}
+    for k, v in AVAILABLE_MODELS.items()
+)
+
 @app.route('/api/models')
+@read_only_session
 def api_models():
     """Get available models."""
     return jsonify({
-        'models': [
-            {'id': k, 'name': v['name'], 'description': v['description'], 'tier': v['tier']}
-            for k, v in AVAILABLE_MODELS.items()
-        ],
+        'models': MODEL_LIST,
         'default': DEFAULT_MODEL,
         'current': session.get('model', DEFAULT_MODEL)
     })
@@ -136,7 +268,6 @@ def api_new_game():
     
     # Create character
     state = create_character(name, player_class)
-    set_game_state(state)
     
     # Generate opening with DM
     dm = get_dm()
@@ -149,7 +280,7 @@ def api_new_game():
     
     # Update state
     state.location = opening.get('location_name', 'The Rusty Tankard')
-    state.visited_locations.append(state.location)
+    state.mark_visited(state.location)
     
     # Set up main quest
     if 'main_quest_hook' in opening:
@@ -163,9 +294,8 @@ def api_new_game():
     state.log_event(f"Adventure begins at {state.location}")
     set_game_state(state)
     
-    # Generate scene image
-    image_prompt = f"dark fantasy tavern interior, {state.location}, moody lighting, medieval, atmospheric fog, dramatic shadows"
-    image_url = generate_scene_image(image_prompt)
+    image_url = get_scene_image(state.location)
+    prewarm_images(image_url)
     
     return jsonify({
         'success': True,
@@ -230,7 +360,7 @@ def api_choice():
     success, result, error = dm.generate_choice_result(
         state.location, state.name, state.player_class,
         state.hp, state.max_hp, state.gold, state.inventory,
-        state.active_quest, " | ".join(state.story_log[-3:]),
+        state.active_quest, state.recent_context,
         choice_text, choice_type, skill_check_result
     )
     
@@ -263,25 +393,26 @@ def api_choice():
     # Update location
     if result.get('new_location'):
         state.location = result['new_location']
-        state.visited_locations.append(state.location)
-    
-    set_game_state(state)
+        state.mark_visited(state.location)
     
-    # Generate image for new scene
-    image_prompt = f"dark fantasy {state.location}, moody lighting, medieval, atmospheric fog, dramatic shadows, cinematic"
-    image_url = generate_scene_image(image_prompt)
+    # Scene images are keyed on the location alone, so every endpoint and every
+    # turn in the same place shows the same picture
+    image_url = get_scene_image(state.location)
+    if result.get('new_location'):
+        prewarm_images(image_url)
     
     # Check for combat
     if result.get('triggers_combat') and result.get('enemy'):
         enemy_data = result['enemy']
         enemy = create_enemy_from_llm(enemy_data)
-        state.current_enemy = enemy.to_dict()
+        state.current_enemy = enemy
         state.in_combat = True
         state.sneak_attack_available = True
         set_game_state(state)
         
         # Generate enemy image
         enemy_image = generate_enemy_image(enemy.name, enemy.description)
+        prewarm_images(enemy_image)
         
         return jsonify({
             'success': True,
@@ -302,24 +433,19 @@ def api_choice():
             'skill_check': skill_check_result if skill_check_result else None
         })
     
-    # Generate next choices
-    if result.get('follow_up_choices'):
-        choices = result['follow_up_choices']
-    else:
+    # Next choices usually come back with the result (some models name the key
+    # "choices"); only a reply with neither costs a second DM round-trip
+    choices = result.get('follow_up_choices') or result.get('choices')
+    if not choices:
         _, location_data, _ = dm.generate_location(
             state.location, state.name, state.player_class,
             state.hp, state.max_hp, state.gold, state.inventory,
-            state.active_quest, " | ".join(state.story_log[-3:]),
+            state.active_quest, state.recent_context,
             state.world_flags
         )
-        choices = location_data.get('choices', [{'id': 1, 'text': 'Continue', 'type': 'explore'}])
-        
-        # Update image for new location
-        if location_data.get('location_name'):
-            state.location = location_data.get('location_name', state.location)
-            image_prompt = f"dark fantasy {state.location}, moody lighting, medieval, atmospheric fog, dramatic shadows"
-            image_url = generate_scene_image(image_prompt)
+        choices = location_data.get('choices') or [{'id': 1, 'text': 'Continue', 'type': 'explore'}]
     
+    # Single write per turn - state is mutated in place above
     set_game_state(state)
     
     return jsonify({
@@ -346,7 +472,7 @@ def api_combat_action():
     action = data.get('action', 'attack')
     
     dm = get_dm()
-    enemy = Enemy.from_dict(state.current_enemy)
+    enemy = state.current_enemy
     result_data = {'player_action': action}
     
     # Player action
@@ -407,7 +533,6 @@ def api_combat_action():
         })
     
     # Enemy turn
-    enemy = Enemy.from_dict(state.current_enemy)
     if enemy.hp > 0:
         enemy_result = enemy_attack(state)
         result_data['enemy_result'] = {
@@ -429,15 +554,14 @@ def api_combat_action():
             **result_data
         })
     
-    # Get combat narration
-    enemy = Enemy.from_dict(state.current_enemy)
+    # Narrate both sides of the exchange in a single DM call
     _, narration, _ = dm.generate_combat_narration(
         state.name, state.player_class,
         state.hp, state.max_hp,
         enemy.name, enemy.hp, enemy.max_hp,
         state.turn_count,
-        action, str(result_data.get('player_result', {})),
-        'attack', str(result_data.get('enemy_result', {}))
+        action, describe_combat_result(result_data.get('player_result')),
+        'attack', describe_combat_result(result_data.get('enemy_result'))
     )
     
     set_game_state(state)
@@ -478,9 +602,9 @@ def api_load():
     if state:
         set_game_state(state)
         
-        # Generate current scene image
-        image_prompt = f"dark fantasy {state.location}, moody lighting, medieval, atmospheric fog"
-        image_url = generate_scene_image(image_prompt)
+        # Generate current scene image and start it rendering right away
+        image_url = get_scene_image(state.location)
+        prewarm_images(image_url)
         
         return jsonify({
             'success': True,
@@ -493,6 +617,7 @@ def api_load():
     return jsonify({'success': False, 'error': msg}), 400
 
 @app.route('/api/inventory')
+@read_only_session
 def api_inventory():
     """Get player inventory."""
     state = get_game_state()
@@ -506,6 +631,7 @@ def api_inventory():
     })
 
 @app.route('/api/stats')
+@read_only_session
 def api_stats():
     """Get player stats."""
     state = get_game_state()
@@ -518,6 +644,27 @@ def api_stats():
 # HELPERS
 # =============================================================================
 
+def prewarm_images(*urls):
+    """Start rendering image URLs in the background without delaying the response."""
+    for url in urls:
+        if url:
+            prewarm_executor.submit(prewarm_image, url)
+
+def get_scene_image(scene):
+    """Get the scene image URL for a location, using one shared prompt template."""
+    return generate_scene_image(SCENE_IMAGE_PROMPT.format(scene=scene))
+
+def describe_combat_result(result):
+    """Summarize a combat result dict as a short phrase for the DM prompt."""
+    if not result:
+        return "no action"
+    text = result.get('message', '').rstrip('.!')
+    damage = result.get('damage')
+    # Ability messages already state their damage ("Dealt 7 fire damage")
+    if damage and 'damage' not in text:
+        text += f" ({damage} damage)"
+    return text
+
 def get_player_data(state):
     """Get player data dict for JSON response."""
     return {
@@ -544,5 +691,6 @@ def get_player_data(state):
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     debug = os.environ.get('FLASK_DEBUG', 'false').lower() == 'true'
-    app.run(host='0.0.0.0', port=port, debug=debug)
+    # Threaded so one slow LLM call doesn't block every other request
+    app.run(host='0.0.0.0', port=port, debug=debug, threaded=True)
 
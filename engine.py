@@ -21,12 +21,25 @@ To modify stat generation:
     Edit generate_stats() function
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import Optional
+from dataclasses import dataclass, field, fields
+from typing import NamedTuple, Optional
 import random
 import json
 import os
+from collections import Counter, deque
 from datetime import datetime
+from itertools import islice
+from types import MappingProxyType
+
+try:
+    import orjson  # Optional: much faster save/load
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack  # Optional: compact binary saves
+except ImportError:
+    msgpack = None
 
 # =============================================================================
 # CONFIGURATION
@@ -34,6 +47,8 @@ from datetime import datetime
 
 DEBUG = False  # Set to True to print state transitions and rolls
 
+# Call sites wrap debug_log in `if DEBUG:` so the f-string message is never
+# built when debugging is off
 def debug_log(message: str) -> None:
     """Print debug message if DEBUG mode is enabled."""
     if DEBUG:
@@ -173,6 +188,59 @@ ITEMS = {
     }
 }
 
+# The tables are read-only at runtime - freeze them so nothing mutates shared data
+CLASSES = MappingProxyType(CLASSES)
+WEAPONS = MappingProxyType(WEAPONS)
+ITEMS = MappingProxyType(ITEMS)
+
+STAT_NAMES = ("STR", "DEX", "INT", "CHA")
+
+# Weapon data used when nothing (or an unknown weapon) is equipped
+UNARMED = MappingProxyType({"damage_dice": (1, 2), "stat": "STR", "description": "Bare fists"})
+
+# Item type indexes so inventory scans are a single set/dict lookup per item
+ARMOR_BONUSES = MappingProxyType({
+    name: data.get("ac_bonus", 0) for name, data in ITEMS.items() if data.get("type") == "armor"
+})
+KEY_ITEMS = frozenset(name for name, data in ITEMS.items() if data.get("type") == "key_item")
+CONSUMABLE_ITEMS = frozenset(name for name, data in ITEMS.items() if data.get("type") == "consumable")
+SKILL_BONUS_ITEMS = MappingProxyType({
+    stat: tuple(
+        (name, data.get("bonus", 0)) for name, data in ITEMS.items()
+        if data.get("effect") == "skill_bonus" and data.get("skill") == stat
+    )
+    for stat in STAT_NAMES
+})
+
+def parse_dice_expression(value) -> tuple[tuple, int]:
+    """Split a value like "2d4+2" into ((num_dice, die_size), ...) and a flat bonus."""
+    if not (isinstance(value, str) and "d" in value):
+        return (), int(value)
+    dice_terms = []
+    bonus = 0
+    for part in value.replace("+", " ").replace("-", " -").split():
+        if "d" in part:
+            num, die = part.split("d")
+            dice_terms.append((int(num) if num else 1, int(die)))
+        else:
+            bonus += int(part)
+    return tuple(dice_terms), bonus
+
+# Healing item values parsed once instead of on every use
+HEAL_DICE = MappingProxyType({
+    name: parse_dice_expression(data["value"])
+    for name, data in ITEMS.items() if data.get("effect") == "heal"
+})
+
+# Starting inventory and first weapon per class, resolved once for create_character
+STARTING_KITS = MappingProxyType({
+    player_class: (
+        tuple(data["starting_items"]),
+        next((item for item in data["starting_items"] if item in WEAPONS), "Fists")
+    )
+    for player_class, data in CLASSES.items()
+})
+
 # =============================================================================
 # DICE SYSTEM
 # =============================================================================
@@ -190,11 +258,26 @@ class DiceRoller:
     
     def roll(self, num_dice: int, die_size: int) -> tuple[list[int], int]:
         """Roll multiple dice and return individual rolls and total."""
-        rolls = [self.rng.randint(1, die_size) for _ in range(num_dice)]
+        if num_dice == 1:
+            rolls = [self.rng.randint(1, die_size)]
+        else:
+            # One bulk draw instead of a randint() call per die
+            rolls = self.rng.choices(range(1, die_size + 1), k=num_dice)
         total = sum(rolls)
-        debug_log(f"Rolled {num_dice}d{die_size}: {rolls} = {total}")
+        if DEBUG:
+            debug_log(f"Rolled {num_dice}d{die_size}: {rolls} = {total}")
         return rolls, total
     
+    def roll_many(self, num_dice: int, die_size: int, count: int) -> list[int]:
+        """
+        Roll NdX `count` times and return just the totals.
+        For simulations and balance tuning - one bulk draw, no per-roll logging.
+        """
+        rolls = self.rng.choices(range(1, die_size + 1), k=num_dice * count)
+        if num_dice == 1:
+            return rolls
+        return [sum(rolls[i:i + num_dice]) for i in range(0, len(rolls), num_dice)]
+    
     def roll_d20(self, modifier: int = 0, stat_name: str = "", 
                  advantage: bool = False, disadvantage: bool = False) -> tuple[int, int, str]:
         """
@@ -226,7 +309,8 @@ class DiceRoller:
         else:
             display = f"d20: {raw}{adv_str}"
         
-        debug_log(f"D20 Roll: {display}")
+        if DEBUG:
+            debug_log(f"D20 Roll: {display}")
         return raw, total, display
     
     def roll_damage(self, num_dice: int, die_size: int, modifier: int = 0, 
@@ -266,7 +350,9 @@ def set_dice_seed(seed: int) -> None:
 # GAME STATE
 # =============================================================================
 
-@dataclass
+STORY_LOG_SIZE = 10  # Story events kept for LLM context
+
+@dataclass(slots=True)
 class GameState:
     """Complete game state - all data needed to save/load a game."""
     
@@ -308,69 +394,126 @@ class GameState:
     
     # Combat state
     in_combat: bool = False
-    current_enemy: Optional[dict] = None
+    current_enemy: Optional["Enemy"] = None  # Live object; serialized only by to_dict
     
     # Session tracking
     turn_count: int = 0
     story_summary: str = ""
-    story_log: list = field(default_factory=list)  # Key events for LLM context
+    story_log: deque = field(default_factory=lambda: deque(maxlen=STORY_LOG_SIZE))  # Key events for LLM context
     
     # Game meta
     game_started: bool = False
     game_over: bool = False
     ending: Optional[str] = None
     
+    # Derived caches - rebuilt in __post_init__, never saved
+    _ability_info: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _weapon_data: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _scores: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _modifiers: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _visited: set = field(default_factory=set, init=False, repr=False, compare=False)
+    _story_tail: str = field(default="", init=False, repr=False, compare=False)
+    _item_counts: Counter = field(default_factory=Counter, init=False, repr=False, compare=False)
+    _ac_cache: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _usable_cache: Optional[list] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Build derived caches from the saved fields."""
+        self._ability_info = CLASSES.get(self.player_class, CLASSES["fighter"])["ability"]
+        self._weapon_data = WEAPONS.get(self.equipped_weapon, UNARMED)
+        # Flat stat -> value lookups; `stats` keeps the nested layout the API and saves use
+        self._scores = {stat: data.get("score", 10) for stat, data in self.stats.items()}
+        self._modifiers = {stat: data.get("modifier", 0) for stat, data in self.stats.items()}
+        self._visited = set(self.visited_locations)
+        self.story_log = deque(self.story_log, maxlen=STORY_LOG_SIZE)
+        self._story_tail = self._join_recent_events()
+        self._item_counts = Counter(self.inventory)
+    
+    def to_dict(self) -> dict:
+        """
+        Convert to dictionary for state storage (derived caches left out).
+        Shallow - nested lists/dicts are shared, so encode the result right away.
+        """
+        data = {name: getattr(self, name) for name in SAVED_FIELDS}
+        data["story_log"] = list(self.story_log)
+        if self.current_enemy is not None:
+            data["current_enemy"] = self.current_enemy.to_dict()
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'GameState':
+        """Create GameState from dictionary."""
+        if isinstance(data.get("current_enemy"), dict):
+            data = {**data, "current_enemy": Enemy.from_dict(data["current_enemy"])}
+        return cls(**data)
+    
     def get_modifier(self, stat: str) -> int:
         """Get the modifier for a stat."""
-        return self.stats.get(stat, {}).get("modifier", 0)
+        return self._modifiers.get(stat, 0)
     
     def get_score(self, stat: str) -> int:
         """Get the score for a stat."""
-        return self.stats.get(stat, {}).get("score", 10)
+        return self._scores.get(stat, 10)
     
     def get_ac(self) -> int:
-        """Calculate total AC from base + armor + DEX."""
-        base_ac = 10 + self.get_modifier("DEX")
-        armor_bonus = 0
-        for item in self.inventory:
-            if item in ITEMS and ITEMS[item].get("type") == "armor":
-                armor_bonus = max(armor_bonus, ITEMS[item].get("ac_bonus", 0))
-        return base_ac + armor_bonus
+        """Calculate total AC from base + armor + DEX (cached until the inventory changes)."""
+        if self._ac_cache is None:
+            base_ac = 10 + self.get_modifier("DEX")
+            armor_bonus = max((ARMOR_BONUSES[item] for item in self.inventory if item in ARMOR_BONUSES), default=0)
+            self._ac_cache = base_ac + armor_bonus
+        return self._ac_cache
+    
+    def get_usable_items(self) -> list:
+        """Consumables in the inventory, in inventory order (cached until the inventory changes)."""
+        if self._usable_cache is None:
+            self._usable_cache = [item for item in self.inventory if item in CONSUMABLE_ITEMS]
+        return self._usable_cache
     
     def add_to_inventory(self, item: str) -> None:
         """Add item to inventory."""
         self.inventory.append(item)
-        debug_log(f"Added {item} to inventory")
+        self._item_counts[item] += 1
+        self._ac_cache = None
+        self._usable_cache = None
+        if DEBUG:
+            debug_log(f"Added {item} to inventory")
     
     def remove_from_inventory(self, item: str) -> bool:
         """Remove item from inventory. Returns True if successful."""
-        if item in self.inventory:
+        if self._item_counts[item] > 0:
             self.inventory.remove(item)
-            debug_log(f"Removed {item} from inventory")
+            self._item_counts[item] -= 1
+            self._ac_cache = None
+            self._usable_cache = None
+            if DEBUG:
+                debug_log(f"Removed {item} from inventory")
             return True
         return False
     
     def has_item(self, item: str) -> bool:
         """Check if player has an item."""
-        return item in self.inventory
+        return self._item_counts[item] > 0
     
     def add_gold(self, amount: int) -> None:
         """Add gold (can be negative but won't go below 0)."""
         self.gold = max(0, self.gold + amount)
-        debug_log(f"Gold changed by {amount}, now {self.gold}")
+        if DEBUG:
+            debug_log(f"Gold changed by {amount}, now {self.gold}")
     
     def heal(self, amount: int) -> int:
         """Heal HP up to max. Returns amount actually healed."""
         actual = min(amount, self.max_hp - self.hp)
         self.hp += actual
-        debug_log(f"Healed {actual} HP, now {self.hp}/{self.max_hp}")
+        if DEBUG:
+            debug_log(f"Healed {actual} HP, now {self.hp}/{self.max_hp}")
         return actual
     
     def take_damage(self, amount: int) -> int:
         """Take damage. Returns actual damage taken."""
         actual = min(amount, self.hp)
         self.hp -= actual
-        debug_log(f"Took {actual} damage, now {self.hp}/{self.max_hp}")
+        if DEBUG:
+            debug_log(f"Took {actual} damage, now {self.hp}/{self.max_hp}")
         return actual
     
     def is_dead(self) -> bool:
@@ -380,7 +523,8 @@ class GameState:
     def set_flag(self, flag: str, value: any = True) -> None:
         """Set a world flag."""
         self.world_flags[flag] = value
-        debug_log(f"Flag set: {flag} = {value}")
+        if DEBUG:
+            debug_log(f"Flag set: {flag} = {value}")
     
     def get_flag(self, flag: str, default: any = None) -> any:
         """Get a world flag value."""
@@ -391,7 +535,8 @@ class GameState:
         self.quests[quest_id] = quest_data
         if self.active_quest is None:
             self.active_quest = quest_id
-        debug_log(f"Quest added/updated: {quest_id}")
+        if DEBUG:
+            debug_log(f"Quest added/updated: {quest_id}")
     
     def complete_quest(self, quest_id: str) -> None:
         """Mark a quest as complete."""
@@ -399,34 +544,64 @@ class GameState:
             self.quests[quest_id]["status"] = "complete"
             if self.active_quest == quest_id:
                 self.active_quest = None
-            debug_log(f"Quest completed: {quest_id}")
+            if DEBUG:
+                debug_log(f"Quest completed: {quest_id}")
     
     def log_event(self, event: str) -> None:
-        """Add an event to story log (keeps last 10)."""
+        """Add an event to story log (the deque drops anything past the last 10)."""
         self.story_log.append(event)
-        if len(self.story_log) > 10:
-            self.story_log = self.story_log[-10:]
-        debug_log(f"Event logged: {event}")
+        self._story_tail = self._join_recent_events()
+        if DEBUG:
+            debug_log(f"Event logged: {event}")
+    
+    def recent_events(self, count: int) -> list:
+        """The last `count` story events, oldest first."""
+        return list(islice(self.story_log, max(0, len(self.story_log) - count), None))
+    
+    def _join_recent_events(self) -> str:
+        """Join the last 3 story events for LLM prompts."""
+        return " | ".join(self.recent_events(3))
+    
+    @property
+    def recent_context(self) -> str:
+        """The last 3 story events joined for LLM prompts."""
+        return self._story_tail
+    
+    def mark_visited(self, location: str) -> None:
+        """Record a location as visited (each location is listed once)."""
+        if location not in self._visited:
+            self._visited.add(location)
+            self.visited_locations.append(location)
+    
+    def has_visited(self, location: str) -> bool:
+        """Check if the player has been to a location."""
+        return location in self._visited
     
     def get_equipped_weapon_data(self) -> dict:
-        """Get the currently equipped weapon's data."""
-        if self.equipped_weapon in WEAPONS:
-            return WEAPONS[self.equipped_weapon]
-        return {"damage_dice": (1, 2), "stat": "STR", "description": "Bare fists"}
+        """Get the currently equipped weapon's data (cached when equipped)."""
+        return self._weapon_data
+    
+    def equip_weapon(self, weapon: str) -> None:
+        """Equip a weapon and cache its data."""
+        self.equipped_weapon = weapon
+        self._weapon_data = WEAPONS.get(weapon, UNARMED)
+        if DEBUG:
+            debug_log(f"Equipped {weapon}")
     
     def get_class_data(self) -> dict:
         """Get the player's class data."""
         return CLASSES.get(self.player_class, CLASSES["fighter"])
     
     def get_ability_info(self) -> dict:
-        """Get the player's class ability info."""
-        return self.get_class_data().get("ability", {})
+        """Get the player's class ability info (cached at creation)."""
+        return self._ability_info
     
     def use_ability(self) -> bool:
         """Try to use class ability. Returns True if successful."""
         if self.ability_uses > 0:
             self.ability_uses -= 1
-            debug_log(f"Ability used, {self.ability_uses} uses remaining")
+            if DEBUG:
+                debug_log(f"Ability used, {self.ability_uses} uses remaining")
             return True
         return False
     
@@ -440,14 +615,26 @@ class GameState:
         # Restore abilities with "rest" cooldown
         if self.get_ability_info().get("cooldown_type") == "rest":
             self.ability_uses = self.ability_max_uses
-        debug_log("Rested - HP and rest-based abilities restored")
+        if DEBUG:
+            debug_log("Rested - HP and rest-based abilities restored")
+
+# Fields written by GameState.to_dict - resolved once instead of per save
+SAVED_FIELDS = tuple(f.name for f in fields(GameState) if not f.name.startswith("_"))
 
 # =============================================================================
 # CHARACTER CREATION
 # =============================================================================
 
+# Modifier for every score from 0 to 30 (D&D 5e style)
+MODIFIER_TABLE = tuple((score - 10) // 2 for score in range(31))
+
 def calculate_modifier(score: int) -> int:
-    """Calculate ability modifier from score (D&D 5e style)."""
+    """
+    Calculate ability modifier from score (D&D 5e style).
+    Hot paths should read GameState.get_modifier() or MODIFIER_TABLE directly.
+    """
+    if 0 <= score < len(MODIFIER_TABLE):
+        return MODIFIER_TABLE[score]
     return (score - 10) // 2
 
 def generate_stats(player_class: str) -> dict:
@@ -456,10 +643,12 @@ def generate_stats(player_class: str) -> dict:
     primary = class_data["primary_stat"]
     
     stats = {}
-    for stat in ["STR", "DEX", "INT", "CHA"]:
-        # Roll 4d6, drop lowest
-        rolls = sorted([dice.rng.randint(1, 6) for _ in range(4)])
-        score = sum(rolls[1:])  # Drop lowest
+    # 4d6 for every stat in one bulk draw
+    rolls = dice.rng.choices(range(1, 7), k=4 * len(STAT_NAMES))
+    for i, stat in enumerate(STAT_NAMES):
+        # Drop the lowest die of this stat's group
+        r0, r1, r2, r3 = rolls[4 * i:4 * i + 4]
+        score = r0 + r1 + r2 + r3 - min(r0, r1, r2, r3)
         
         # Bonus for primary stat
         if stat == primary:
@@ -467,10 +656,11 @@ def generate_stats(player_class: str) -> dict:
         
         stats[stat] = {
             "score": score,
-            "modifier": calculate_modifier(score)
+            "modifier": MODIFIER_TABLE[score]  # 3-18 here, always inside the table
         }
     
-    debug_log(f"Generated stats for {player_class}: {stats}")
+    if DEBUG:
+        debug_log(f"Generated stats for {player_class}: {stats}")
     return stats
 
 def create_character(name: str, player_class: str) -> GameState:
@@ -480,6 +670,7 @@ def create_character(name: str, player_class: str) -> GameState:
         player_class = "fighter"
     
     class_data = CLASSES[player_class]
+    starting_items, starting_weapon = STARTING_KITS[player_class]
     stats = generate_stats(player_class)
     
     state = GameState(
@@ -489,29 +680,25 @@ def create_character(name: str, player_class: str) -> GameState:
         hp=class_data["base_hp"],
         max_hp=class_data["base_hp"],
         gold=class_data["starting_gold"],
-        inventory=list(class_data["starting_items"]),
+        inventory=list(starting_items),
+        equipped_weapon=starting_weapon,
         ability_uses=class_data["ability"]["uses"],
         ability_max_uses=class_data["ability"]["uses"],
         game_started=True
     )
     
-    # Equip first weapon found
-    for item in state.inventory:
-        if item in WEAPONS:
-            state.equipped_weapon = item
-            break
-    
     # Calculate AC
     state.ac = state.get_ac()
     
-    debug_log(f"Character created: {name} the {player_class}")
+    if DEBUG:
+        debug_log(f"Character created: {name} the {player_class}")
     return state
 
 # =============================================================================
 # COMBAT SYSTEM
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Enemy:
     """Enemy data structure."""
     name: str
@@ -546,73 +733,91 @@ class Enemy:
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Enemy':
-        """Create Enemy from dictionary."""
-        data["damage_dice"] = tuple(data["damage_dice"])
-        data["gold_drop"] = tuple(data["gold_drop"])
-        return cls(**data)
+        """Create Enemy from dictionary (the dict itself is left untouched)."""
+        return cls(**{
+            **data,
+            "damage_dice": tuple(data["damage_dice"]),
+            "gold_drop": tuple(data["gold_drop"])
+        })
+
+# (min, max, default) for every numeric field the LLM supplies
+ENEMY_LIMITS = MappingProxyType({
+    "hp": (1, 100, 10),
+    "ac": (8, 20, 12),
+    "attack_bonus": (-2, 8, 2),
+    "damage_bonus": (0, 5, 1),
+    "xp": (10, 500, 25),
+    "num_dice": (1, 4, 1),
+    "die_size": (4, 12, 6),
+    "gold": (0, 1000, 1),
+})
+
+def clamp_int(value, field_name: str) -> int:
+    """Coerce an LLM-supplied number into ENEMY_LIMITS[field_name], falling back to its default."""
+    low, high, default = ENEMY_LIMITS[field_name]
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return default
+    return low if value < low else high if value > high else value
 
 def create_enemy_from_llm(enemy_data: dict) -> Enemy:
     """Create an enemy from LLM-generated data with validation."""
     # Provide sensible defaults and clamp values
-    name = enemy_data.get("name", "Mysterious Creature")
-    hp = max(1, min(100, enemy_data.get("hp", 10)))
-    ac = max(8, min(20, enemy_data.get("ac", 12)))
-    attack_bonus = max(-2, min(8, enemy_data.get("attack_bonus", 2)))
-    
-    damage_dice = enemy_data.get("damage_dice", [1, 6])
-    if isinstance(damage_dice, list) and len(damage_dice) == 2:
-        num_dice = max(1, min(4, damage_dice[0]))
-        die_size = max(4, min(12, damage_dice[1]))
-        damage_dice = (num_dice, die_size)
+    get = enemy_data.get
+    hp = clamp_int(get("hp", 10), "hp")
+    
+    damage_dice = get("damage_dice")
+    if isinstance(damage_dice, (list, tuple)) and len(damage_dice) == 2:
+        damage_dice = (clamp_int(damage_dice[0], "num_dice"), clamp_int(damage_dice[1], "die_size"))
     else:
         damage_dice = (1, 6)
     
-    damage_bonus = max(0, min(5, enemy_data.get("damage_bonus", 1)))
-    xp = max(10, min(500, enemy_data.get("xp", 25)))
-    
-    gold_drop = enemy_data.get("gold_drop", [1, 5])
-    if isinstance(gold_drop, list) and len(gold_drop) == 2:
-        gold_drop = (max(0, gold_drop[0]), max(gold_drop[0], gold_drop[1]))
+    gold_drop = get("gold_drop")
+    if isinstance(gold_drop, (list, tuple)) and len(gold_drop) == 2:
+        gold_min = clamp_int(gold_drop[0], "gold")
+        gold_drop = (gold_min, max(gold_min, clamp_int(gold_drop[1], "gold")))
     else:
         gold_drop = (1, 5)
     
+    loot = get("loot")
+    
     return Enemy(
-        name=name,
+        name=str(get("name") or "Mysterious Creature"),
         hp=hp,
         max_hp=hp,
-        ac=ac,
-        attack_bonus=attack_bonus,
+        ac=clamp_int(get("ac", 12), "ac"),
+        attack_bonus=clamp_int(get("attack_bonus", 2), "attack_bonus"),
         damage_dice=damage_dice,
-        damage_bonus=damage_bonus,
-        xp=xp,
+        damage_bonus=clamp_int(get("damage_bonus", 1), "damage_bonus"),
+        xp=clamp_int(get("xp", 25), "xp"),
         gold_drop=gold_drop,
-        behavior=enemy_data.get("behavior", "aggressive"),
-        description=enemy_data.get("description", ""),
-        loot=enemy_data.get("loot", [])
+        behavior=get("behavior", "aggressive"),
+        description=get("description", ""),
+        loot=[str(item) for item in loot] if isinstance(loot, list) else []
     )
 
-class CombatResult:
-    """Result of a combat action."""
-    def __init__(self, success: bool, message: str, damage: int = 0, 
-                 roll_display: str = "", critical: bool = False):
-        self.success = success
-        self.message = message
-        self.damage = damage
-        self.roll_display = roll_display
-        self.critical = critical
+class CombatResult(NamedTuple):
+    """Result of a combat action (immutable, built in C)."""
+    success: bool
+    message: str
+    damage: int = 0
+    roll_display: str = ""
+    critical: bool = False
 
 def player_attack(state: GameState, use_sneak_attack: bool = False) -> CombatResult:
     """Player attacks the current enemy."""
     if not state.current_enemy:
         return CombatResult(False, "No enemy to attack!")
     
-    enemy = Enemy.from_dict(state.current_enemy)
+    enemy = state.current_enemy
+    roller = dice  # One global lookup for the to-hit, damage and sneak rolls
     weapon = state.get_equipped_weapon_data()
     stat_name = weapon["stat"]
     modifier = state.get_modifier(stat_name)
     
     # Roll to hit
-    raw, total, roll_display = dice.roll_d20(modifier, stat_name)
+    raw, total, roll_display = roller.roll_d20(modifier, stat_name)
     
     critical = raw == 20
     critical_miss = raw == 1
@@ -627,17 +832,16 @@ def player_attack(state: GameState, use_sneak_attack: bool = False) -> CombatRes
         if critical:
             num_dice *= 2  # Double dice on crit
         
-        damage, dmg_display = dice.roll_damage(num_dice, die_size, modifier, stat_name)
+        damage, dmg_display = roller.roll_damage(num_dice, die_size, modifier, stat_name)
         
         # Add sneak attack if applicable
         if use_sneak_attack and state.player_class == "rogue" and state.sneak_attack_available:
-            sneak_rolls, sneak_total = dice.roll(2, 6)
+            sneak_rolls, sneak_total = roller.roll(2, 6)
             damage += sneak_total
             dmg_display += f" + Sneak({sneak_total})"
             state.sneak_attack_available = False
         
         enemy.hp -= damage
-        state.current_enemy = enemy.to_dict()
         
         crit_text = " CRITICAL HIT!" if critical else ""
         return CombatResult(True, f"Hit!{crit_text}", damage, 
@@ -651,10 +855,11 @@ def enemy_attack(state: GameState) -> CombatResult:
     if not state.current_enemy:
         return CombatResult(False, "No enemy!")
     
-    enemy = Enemy.from_dict(state.current_enemy)
+    enemy = state.current_enemy
+    roller = dice
     player_ac = state.get_ac()
     
-    raw, total, roll_display = dice.roll_d20(enemy.attack_bonus, "ATK")
+    raw, total, roll_display = roller.roll_d20(enemy.attack_bonus, "ATK")
     
     critical = raw == 20
     critical_miss = raw == 1
@@ -668,7 +873,7 @@ def enemy_attack(state: GameState) -> CombatResult:
         if critical:
             num_dice *= 2
         
-        damage, dmg_display = dice.roll_damage(num_dice, die_size, enemy.damage_bonus)
+        damage, dmg_display = roller.roll_damage(num_dice, die_size, enemy.damage_bonus)
         state.take_damage(damage)
         
         crit_text = " CRITICAL!" if critical else ""
@@ -700,9 +905,7 @@ def use_class_ability(state: GameState) -> tuple[bool, str, int]:
         # Fireball: 3d6
         _, damage = dice.roll(3, 6)
         if state.current_enemy:
-            enemy = Enemy.from_dict(state.current_enemy)
-            enemy.hp -= damage
-            state.current_enemy = enemy.to_dict()
+            state.current_enemy.hp -= damage
         return True, f"Fireball! Dealt {damage} fire damage!", damage
     
     elif ability["effect"] == "damage_boost":
@@ -727,6 +930,8 @@ def attempt_flee(state: GameState) -> tuple[bool, str]:
     else:
         return False, f"[Flee] {roll_display} vs DC 12 - Failed to escape!"
 
+LOOT_DROP_CHANCE = 0.3  # Independent chance for each item in an enemy's loot list
+
 def check_combat_end(state: GameState) -> tuple[bool, str, dict]:
     """
     Check if combat has ended.
@@ -740,18 +945,17 @@ def check_combat_end(state: GameState) -> tuple[bool, str, dict]:
         return True, "defeat", {}
     
     if state.current_enemy:
-        enemy = Enemy.from_dict(state.current_enemy)
+        enemy = state.current_enemy
         if enemy.hp <= 0:
             # Victory!
             gold = dice.rng.randint(*enemy.gold_drop)
             state.add_gold(gold)
             
             # Check for loot
-            loot = []
-            for item in enemy.loot:
-                if dice.rng.random() < 0.3:  # 30% drop chance
-                    loot.append(item)
-                    state.add_to_inventory(item)
+            rand = dice.rng.random
+            loot = [item for item in enemy.loot if rand() < LOOT_DROP_CHANCE]
+            for item in loot:
+                state.add_to_inventory(item)
             
             state.in_combat = False
             state.current_enemy = None
@@ -779,12 +983,10 @@ def skill_check(state: GameState, stat: str, dc: int,
     raw, total, roll_display = dice.roll_d20(modifier, stat)
     
     # Check for tool bonuses
-    for item in state.inventory:
-        if item in ITEMS:
-            item_data = ITEMS[item]
-            if item_data.get("effect") == "skill_bonus" and item_data.get("skill") == stat:
-                total += item_data.get("bonus", 0)
-                roll_display += f" + {item}(+{item_data.get('bonus', 0)})"
+    for item, item_bonus in SKILL_BONUS_ITEMS.get(stat, ()):
+        if state.has_item(item):
+            total += item_bonus
+            roll_display += f" + {item}(+{item_bonus})"
     
     success = total >= dc
     result = "SUCCESS!" if success else "FAILED"
@@ -792,7 +994,8 @@ def skill_check(state: GameState, stat: str, dc: int,
     desc = f"[{description}] " if description else ""
     display = f"{desc}{roll_display} vs DC {dc} - {result}"
     
-    debug_log(f"Skill check: {display}")
+    if DEBUG:
+        debug_log(f"Skill check: {display}")
     return success, display
 
 # =============================================================================
@@ -816,21 +1019,10 @@ def use_item(state: GameState, item_name: str) -> tuple[bool, str]:
         return False, f"{item_name} is not consumable."
     
     if item["effect"] == "heal":
-        # Parse value like "2d4+2"
-        value = item["value"]
-        if isinstance(value, str) and "d" in value:
-            parts = value.replace("+", " ").replace("-", " -").split()
-            total = 0
-            for part in parts:
-                if "d" in part:
-                    num, die = part.split("d")
-                    num = int(num) if num else 1
-                    _, roll_total = dice.roll(num, int(die))
-                    total += roll_total
-                else:
-                    total += int(part)
-        else:
-            total = int(value)
+        dice_terms, total = HEAL_DICE[item_name]
+        for num, die in dice_terms:
+            _, roll_total = dice.roll(num, die)
+            total += roll_total
         
         actual = state.heal(total)
         state.remove_from_inventory(item_name)
@@ -850,17 +1042,54 @@ def use_item(state: GameState, item_name: str) -> tuple[bool, str]:
 
 SAVE_VERSION = "1.0"
 SAVE_DIR = "saves"
-DEFAULT_SAVE = "save.json"
+MSGPACK_EXT = ".msgpack"
+SAVE_EXTENSIONS = (".json", MSGPACK_EXT)
+LEGACY_SAVE = "save.json"  # Default save name before MessagePack saves
+DEFAULT_SAVE = "save.msgpack" if msgpack is not None else LEGACY_SAVE
+
+def encode_json(data: dict) -> bytes:
+    """Encode save data as indented JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+def decode_json(raw: bytes) -> dict:
+    """Decode JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def encode_save(data: dict, filename: str) -> bytes:
+    """Encode save data in the format picked by the file extension."""
+    if filename.endswith(MSGPACK_EXT):
+        if msgpack is None:
+            raise RuntimeError("msgpack is not installed - save as .json instead")
+        return msgpack.packb(data)
+    return encode_json(data)
+
+def decode_save(raw: bytes, filename: str) -> dict:
+    """Decode save data in the format picked by the file extension."""
+    if filename.endswith(MSGPACK_EXT):
+        if msgpack is None:
+            raise RuntimeError("msgpack is not installed - cannot read .msgpack saves")
+        return msgpack.unpackb(raw)
+    return decode_json(raw)
+
+save_dir_ready = False  # Set once the saves directory is known to exist
 
 def ensure_save_dir() -> None:
-    """Ensure the saves directory exists."""
-    if not os.path.exists(SAVE_DIR):
-        os.makedirs(SAVE_DIR)
-        debug_log(f"Created save directory: {SAVE_DIR}")
+    """Ensure the saves directory exists (checked once per process)."""
+    global save_dir_ready
+    if save_dir_ready:
+        return
+    os.makedirs(SAVE_DIR, exist_ok=True)
+    save_dir_ready = True
+    if DEBUG:
+        debug_log(f"Save directory ready: {SAVE_DIR}")
 
 def save_game(state: GameState, filename: str = DEFAULT_SAVE) -> tuple[bool, str]:
     """
-    Save the game state to a JSON file.
+    Save the game state (MessagePack for .msgpack files, JSON otherwise).
     Returns (success, message)
     """
     try:
@@ -870,33 +1099,40 @@ def save_game(state: GameState, filename: str = DEFAULT_SAVE) -> tuple[bool, str
         save_data = {
             "version": SAVE_VERSION,
             "timestamp": datetime.now().isoformat(),
-            "game_state": asdict(state),
+            "game_state": state.to_dict(),
             "rng_seed": dice.get_seed()
         }
         
-        with open(filepath, "w") as f:
-            json.dump(save_data, f, indent=2)
+        with open(filepath, "wb") as f:
+            f.write(encode_save(save_data, filename))
         
-        debug_log(f"Game saved to {filepath}")
+        if DEBUG:
+            debug_log(f"Game saved to {filepath}")
         return True, f"Game saved to {filepath}"
     
     except Exception as e:
-        debug_log(f"Save failed: {e}")
+        if DEBUG:
+            debug_log(f"Save failed: {e}")
         return False, f"Failed to save: {e}"
 
 def load_game(filename: str = DEFAULT_SAVE) -> tuple[Optional[GameState], str]:
     """
-    Load game state from a JSON file.
+    Load game state (MessagePack for .msgpack files, JSON otherwise).
     Returns (state or None, message)
     """
     try:
         filepath = os.path.join(SAVE_DIR, filename)
         
+        # Fall back to an older JSON quicksave
+        if not os.path.exists(filepath) and filename == DEFAULT_SAVE:
+            filename = LEGACY_SAVE
+            filepath = os.path.join(SAVE_DIR, filename)
+        
         if not os.path.exists(filepath):
             return None, f"Save file not found: {filepath}"
         
-        with open(filepath, "r") as f:
-            save_data = json.load(f)
+        with open(filepath, "rb") as f:
+            save_data = decode_save(f.read(), filename)
         
         # Version check
         if save_data.get("version") != SAVE_VERSION:
@@ -908,23 +1144,24 @@ def load_game(filename: str = DEFAULT_SAVE) -> tuple[Optional[GameState], str]:
         
         # Reconstruct GameState
         state_data = save_data["game_state"]
-        state = GameState(**state_data)
+        state = GameState.from_dict(state_data)
         
-        debug_log(f"Game loaded from {filepath}")
+        if DEBUG:
+            debug_log(f"Game loaded from {filepath}")
         return state, f"Game loaded from {filepath}"
     
     except Exception as e:
-        debug_log(f"Load failed: {e}")
+        if DEBUG:
+            debug_log(f"Load failed: {e}")
         return None, f"Failed to load: {e}"
 
 def list_saves() -> list[str]:
     """List available save files."""
     ensure_save_dir()
-    saves = []
-    for f in os.listdir(SAVE_DIR):
-        if f.endswith(".json"):
-            saves.append(f)
-    return saves
+    # DirEntry.is_file() uses the cached directory entry type - no extra stat
+    with os.scandir(SAVE_DIR) as entries:
+        return [entry.name for entry in entries
+                if entry.name.endswith(SAVE_EXTENSIONS) and entry.is_file()]
 
 # =============================================================================
 # UTILITY FUNCTIONS
@@ -932,40 +1169,33 @@ def list_saves() -> list[str]:
 
 def format_stats(state: GameState) -> str:
     """Format player stats for display."""
-    lines = [f"=== {state.name} the {state.player_class.title()} ==="]
-    lines.append(f"HP: {state.hp}/{state.max_hp} | AC: {state.get_ac()} | Gold: {state.gold}")
-    lines.append("")
-    for stat, data in state.stats.items():
-        mod = data["modifier"]
-        sign = "+" if mod >= 0 else ""
-        lines.append(f"  {stat}: {data['score']} ({sign}{mod})")
-    lines.append("")
     ability = state.get_ability_info()
-    lines.append(f"Ability: {ability['name']} ({state.ability_uses}/{state.ability_max_uses} uses)")
-    lines.append(f"  {ability['description']}")
-    return "\n".join(lines)
+    return "\n".join([
+        f"=== {state.name} the {state.player_class.title()} ===",
+        f"HP: {state.hp}/{state.max_hp} | AC: {state.get_ac()} | Gold: {state.gold}",
+        "",
+        *[f"  {stat}: {data['score']} ({data['modifier']:+d})" for stat, data in state.stats.items()],
+        "",
+        f"Ability: {ability['name']} ({state.ability_uses}/{state.ability_max_uses} uses)",
+        f"  {ability['description']}"
+    ])
 
 def format_inventory(state: GameState) -> str:
     """Format inventory for display."""
-    lines = [f"=== Inventory ({len(state.inventory)} items) ==="]
-    lines.append(f"Gold: {state.gold}")
-    lines.append(f"Equipped: {state.equipped_weapon}")
-    lines.append("")
-    
+    header = (f"=== Inventory ({len(state.inventory)} items) ===\n"
+              f"Gold: {state.gold}\n"
+              f"Equipped: {state.equipped_weapon}\n")
     if not state.inventory:
-        lines.append("  (empty)")
-    else:
-        for item in state.inventory:
-            marker = " [E]" if item == state.equipped_weapon else ""
-            if item in ITEMS:
-                desc = ITEMS[item].get("description", "")
-                lines.append(f"  • {item}{marker}")
-                if desc:
-                    lines.append(f"      {desc}")
-            else:
-                lines.append(f"  • {item}{marker}")
-    
-    return "\n".join(lines)
+        return header + "\n  (empty)"
+    return header + "\n" + "\n".join([format_item_line(item, state.equipped_weapon) for item in state.inventory])
+
+def format_item_line(item: str, equipped_weapon: str) -> str:
+    """Format one inventory entry, with its description on a second line if known."""
+    marker = " [E]" if item == equipped_weapon else ""
+    desc = ITEMS[item].get("description", "") if item in ITEMS else ""
+    if desc:
+        return f"  • {item}{marker}\n      {desc}"
+    return f"  • {item}{marker}"
 
 def format_quests(state: GameState) -> str:
     """Format quest log for display."""
@@ -987,7 +1217,7 @@ def format_quests(state: GameState) -> str:
 
 def get_status_line(state: GameState) -> str:
     """Get the status line shown each turn."""
-    items = [i for i in state.inventory if i in ITEMS and ITEMS[i].get("type") == "key_item"]
+    items = [i for i in state.inventory if i in KEY_ITEMS]
     items_str = ", ".join(items[:3]) if items else "None"
     
     quest_str = "None"
@@ -0,0 +1,27 @@
+// Write .br and .gz copies of the text assets in dist/ so the Flask server
+// can send them precompressed instead of compressing on every request.
+import { readdirSync, readFileSync, statSync, writeFileSync } from 'node:fs'
+import { join, extname } from 'node:path'
+import { brotliCompressSync, gzipSync, constants } from 'node:zlib'
+
+const DIST = new URL('../dist/', import.meta.url).pathname
+const COMPRESSIBLE = new Set(['.js', '.css', '.html', '.svg', '.json'])
+const MIN_SIZE = 1024
+
+function walk(dir) {
+  for (const name of readdirSync(dir)) {
+    const path = join(dir, name)
+    if (statSync(path).isDirectory()) {
+      walk(path)
+    } else if (COMPRESSIBLE.has(extname(name))) {
+      const data = readFileSync(path)
+      if (data.length < MIN_SIZE) continue
+      writeFileSync(`${path}.br`, brotliCompressSync(data, {
+        params: { [constants.BROTLI_PARAM_QUALITY]: constants.BROTLI_MAX_QUALITY },
+      }))
+      writeFileSync(`${path}.gz`, gzipSync(data, { level: 9 }))
+    }
+  }
+}
+
+walk(DIST)
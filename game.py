@@ -11,6 +11,9 @@ Set OPENROUTER_API_KEY environment variable before running.
 import os
 import sys
 import random
+import textwrap
+import threading
+from functools import lru_cache
 from typing import Optional
 
 # Import game modules
@@ -21,7 +24,7 @@ from engine import (
     check_combat_end, skill_check, use_item,
     save_game, load_game, list_saves,
     format_stats, format_inventory, format_quests, get_status_line,
-    CLASSES, WEAPONS, ITEMS, DEBUG as ENGINE_DEBUG
+    CLASSES, WEAPONS, DEBUG as ENGINE_DEBUG
 )
 from llm_dm import (
     DungeonMaster, AVAILABLE_MODELS, DEFAULT_MODEL,
@@ -35,6 +38,10 @@ from llm_dm import (
 
 DEBUG = False  # Master debug flag
 
+# Explore choices resolved in the background while the player decides, so picking
+# one of them is instant. Each costs a DM call whether or not it is picked.
+SPECULATIVE_CHOICES = int(os.environ.get("DM_SPECULATIVE_CHOICES", "0"))
+
 GAME_TITLE = """
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                                                                              ║
@@ -73,79 +80,204 @@ HELP_TEXT = """
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
+# Banners encoded once for the console's codec, not on every print
+STDOUT_ENCODING = getattr(sys.stdout, "encoding", None) or "utf-8"
+GAME_TITLE_BYTES = (GAME_TITLE + "\n").encode(STDOUT_ENCODING, errors="replace")
+HELP_TEXT_BYTES = (HELP_TEXT + "\n").encode(STDOUT_ENCODING, errors="replace")
+
 # =============================================================================
 # DISPLAY UTILITIES
 # =============================================================================
 
+# Cursor home + erase display (+ scrollback) - no `clear` subprocess per redraw
+CLEAR_SEQUENCE = "\x1b[H\x1b[2J\x1b[3J"
+
+def enable_ansi() -> bool:
+    """Check the terminal understands ANSI escapes, turning them on for Windows 10+ consoles."""
+    if os.environ.get("TERM") == "dumb":
+        return False
+    if os.name != 'nt':
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_ulong()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
+
+ANSI_ENABLED = enable_ansi()
+
 def clear_screen() -> None:
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if ANSI_ENABLED:
+        sys.stdout.write(CLEAR_SEQUENCE)
+        sys.stdout.flush()
+    else:
+        os.system('cls' if os.name == 'nt' else 'clear')
+
+# Cursor home + erase to end of screen, leaving the scrollback alone
+REPAINT_SEQUENCE = "\x1b[H\x1b[J"
+
+def repaint_screen() -> None:
+    """Start a redraw of the same scene (combat turns) without wiping the scrollback."""
+    if ANSI_ENABLED:
+        sys.stdout.write(REPAINT_SEQUENCE)
+        sys.stdout.flush()
+    else:
+        clear_screen()
+
+# Shared wrapper for all narrative text (fits inside the 78-column separators)
+TEXT_WRAPPER = textwrap.TextWrapper(width=74, break_long_words=False, break_on_hyphens=False)
+
+@lru_cache(maxsize=256)
+def wrap_text(text: str) -> tuple[str, ...]:
+    """Wrap text into screen lines (memoized - locations are redrawn every turn)."""
+    return tuple(TEXT_WRAPPER.wrap(text))
+
+def print_wrapped(text: str) -> None:
+    """Print text word-wrapped and indented to fit the screen."""
+    for line in wrap_text(text):
+        print(f"  {line}")
+
+class StreamingPrinter:
+    """
+    Word-wrap text onto the screen while it is still arriving (narration streamed
+    from the DM), matching print_wrapped's width and indent.
+    """
+    
+    def __init__(self, width: int = TEXT_WRAPPER.width, indent: str = "  "):
+        self.width = width
+        self.indent = indent
+        self.parts = []
+        self._word = ""      # Trailing partial word, held until it is complete
+        self._column = 0
+    
+    def write(self, fragment: str) -> None:
+        """Show a fragment, clearing the screen on the first one."""
+        if not self.parts:
+            clear_screen()
+            sys.stdout.write("\n")
+        self.parts.append(fragment)
+        text = self._word + fragment
+        words = text.split()
+        self._word = words.pop() if words and not text[-1].isspace() else ""
+        self._emit(words)
+    
+    def finish(self) -> str:
+        """End the current line and return everything that was streamed."""
+        if self._word:
+            self._emit([self._word])
+            self._word = ""
+        if self._column:
+            sys.stdout.write("\n")
+            self._column = 0
+        return "".join(self.parts)
+    
+    def _emit(self, words: list) -> None:
+        out = []
+        for word in words:
+            if not self._column:
+                out.append(self.indent + word)
+                self._column = len(word)
+            elif self._column + 1 + len(word) > self.width:
+                out.append("\n" + self.indent + word)
+                self._column = len(word)
+            else:
+                out.append(" " + word)
+                self._column += 1 + len(word)
+        if out:
+            sys.stdout.write("".join(out))
+            sys.stdout.flush()
+
+def print_paragraphs(text: str, separator: str = "\n\n") -> None:
+    """Print each paragraph word-wrapped, followed by a blank line, in one write."""
+    lines = []
+    for para in text.split(separator):
+        lines.extend(f"  {line}" for line in wrap_text(para))
+        lines.append("")
+    write_lines(lines)
+
+def write_lines(lines: list) -> None:
+    """Write a whole block of lines at once - a single write/flush instead of one per print()."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def write_banner(banner: bytes) -> None:
+    """Write a pre-encoded banner straight to the byte stream under stdout."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # stdout swapped for a text-only stream
+        sys.stdout.write(banner.decode(STDOUT_ENCODING))
+        return
+    sys.stdout.flush()  # keep ordering with text already written
+    buffer.write(banner)
+    buffer.flush()
+
+@lru_cache(maxsize=32)
+def separator(char: str = "━", width: int = 78) -> str:
+    """A separator line (cached - the same few are drawn every frame)."""
+    return char * width
 
 def print_separator(char: str = "━", width: int = 78) -> None:
     """Print a separator line."""
-    print(char * width)
+    print(separator(char, width))
 
 def print_boxed(text: str, width: int = 78) -> None:
     """Print text in a box."""
-    print("┌" + "─" * (width - 2) + "┐")
-    for line in text.split("\n"):
-        padding = width - 4 - len(line)
-        print(f"│ {line}" + " " * padding + " │")
-    print("└" + "─" * (width - 2) + "┘")
+    inner = width - 4
+    rule = separator("─", width - 2)
+    write_lines([
+        f"┌{rule}┐",
+        *[f"│ {line.ljust(inner)} │" for line in text.split("\n")],
+        f"└{rule}┘"
+    ])
 
 def print_location(name: str, description: str, state: GameState) -> None:
     """Print the current location with status."""
-    print()
-    print_separator()
-    print(f"  {name.upper()}")
-    print_separator()
-    print()
-    # Word wrap description
-    words = description.split()
-    lines = []
-    current_line = ""
-    for word in words:
-        if len(current_line) + len(word) + 1 > 74:
-            lines.append(current_line)
-            current_line = word
-        else:
-            current_line = f"{current_line} {word}".strip()
-    if current_line:
-        lines.append(current_line)
-    for line in lines:
-        print(f"  {line}")
-    print()
-    print_separator("─")
-    print(f"  {get_status_line(state)}")
-    print_separator("─")
+    write_lines([
+        "",
+        separator(),
+        f"  {name.upper()}",
+        separator(),
+        "",
+        *[f"  {line}" for line in wrap_text(description)],
+        "",
+        separator("─"),
+        f"  {get_status_line(state)}",
+        separator("─")
+    ])
 
 def print_choices(choices: list, in_combat: bool = False) -> None:
     """Print available choices."""
-    print()
-    if in_combat:
-        print("  YOUR TURN:")
-    else:
-        print("  What do you do?")
-    print()
-    for choice in choices:
-        if isinstance(choice, dict):
-            print(f"    [{choice['id']}] {choice['text']}")
-        else:
-            print(f"    {choice}")
-    print()
+    write_lines([
+        "",
+        "  YOUR TURN:" if in_combat else "  What do you do?",
+        "",
+        *[f"    [{choice['id']}] {choice['text']}" if isinstance(choice, dict) else f"    {choice}"
+          for choice in choices],
+        ""
+    ])
 
 def print_combat_status(state: GameState, enemy: Enemy) -> None:
     """Print combat status."""
     player_bar = create_health_bar(state.hp, state.max_hp, 20)
     enemy_bar = create_health_bar(enemy.hp, enemy.max_hp, 20)
     
-    print()
-    print_separator("═")
-    print("  ⚔️  COMBAT  ⚔️")
-    print_separator("─")
-    print(f"  YOU: {player_bar} {state.hp}/{state.max_hp} HP")
-    print(f"  {enemy.name.upper()}: {enemy_bar} {enemy.hp}/{enemy.max_hp} HP")
-    print_separator("═")
+    write_lines([
+        "",
+        separator("═"),
+        "  ⚔️  COMBAT  ⚔️",
+        separator("─"),
+        f"  YOU: {player_bar} {state.hp}/{state.max_hp} HP",
+        f"  {enemy.name.upper()}: {enemy_bar} {enemy.hp}/{enemy.max_hp} HP",
+        separator("═")
+    ])
+
+# Every possible 20-wide bar, indexed by filled segments (the width combat uses)
+HEALTH_BARS_20 = tuple("[" + "█" * filled + "░" * (20 - filled) + "]" for filled in range(21))
 
 def create_health_bar(current: int, maximum: int, width: int = 20) -> str:
     """Create a text health bar."""
@@ -153,6 +285,8 @@ def create_health_bar(current: int, maximum: int, width: int = 20) -> str:
         return "[" + "?" * width + "]"
     ratio = max(0, min(1, current / maximum))
     filled = int(ratio * width)
+    if width == 20:
+        return HEALTH_BARS_20[filled]
     empty = width - filled
     return "[" + "█" * filled + "░" * empty + "]"
 
@@ -183,66 +317,85 @@ def get_input(prompt: str = "> ") -> str:
     except (EOFError, KeyboardInterrupt):
         return "quit"
 
+def cmd_inventory(state: GameState) -> None:
+    print()
+    print(format_inventory(state))
+    print()
+
+def cmd_stats(state: GameState) -> None:
+    print()
+    print(format_stats(state))
+    print()
+
+def cmd_quests(state: GameState) -> None:
+    print()
+    print(format_quests(state))
+    print()
+
+def cmd_save(state: GameState) -> None:
+    success, msg = save_game(state)
+    if success:
+        print_success(msg)
+    else:
+        print_error(msg)
+
+def cmd_load(state: GameState) -> Optional[tuple[str, dict]]:
+    loaded, msg = load_game()
+    if loaded:
+        print_success(msg)
+        return "load", {"state": loaded}
+    print_error(msg)
+    return None
+
+def cmd_help(state: GameState) -> None:
+    write_banner(HELP_TEXT_BYTES)
+
+def cmd_quit(state: GameState) -> tuple[str, None]:
+    return "quit", None
+
+# Typed command -> handler. A handler returning a tuple ends get_choice with it,
+# returning None goes back to the prompt.
+COMMANDS = {
+    "inventory": cmd_inventory, "i": cmd_inventory,
+    "stats": cmd_stats, "s": cmd_stats,
+    "quests": cmd_quests, "q": cmd_quests,
+    "save": cmd_save,
+    "load": cmd_load,
+    "help": cmd_help, "h": cmd_help, "?": cmd_help,
+    "quit": cmd_quit, "exit": cmd_quit,
+}
+
 def get_choice(choices: list, state: GameState, dm: DungeonMaster) -> tuple[str, Optional[dict]]:
     """
     Get a valid choice from the player.
     Returns (action_type, choice_data)
     action_type: "choice", "command", "quit"
     """
-    valid_ids = [c['id'] if isinstance(c, dict) else i+1 for i, c in enumerate(choices)]
+    # id -> choice; plain-string choices are numbered from 1
+    if all(isinstance(c, dict) for c in choices):  # LLM and combat menus
+        choices_by_id = {c['id']: c for c in choices}
+    else:
+        choices_by_id = {
+            c['id'] if isinstance(c, dict) else i+1: c if isinstance(c, dict) else {"id": i+1, "text": str(c)}
+            for i, c in enumerate(choices)
+        }
     
     while True:
         user_input = get_input()
-        lower = user_input.lower()
         
         # Handle commands
-        if lower in ("inventory", "i"):
-            print()
-            print(format_inventory(state))
-            print()
+        handler = COMMANDS.get(user_input.lower())
+        if handler:
+            result = handler(state)
+            if result is not None:
+                return result
             continue
-        elif lower in ("stats", "s"):
-            print()
-            print(format_stats(state))
-            print()
-            continue
-        elif lower in ("quests", "q"):
-            print()
-            print(format_quests(state))
-            print()
-            continue
-        elif lower == "save":
-            success, msg = save_game(state)
-            if success:
-                print_success(msg)
-            else:
-                print_error(msg)
-            continue
-        elif lower == "load":
-            loaded, msg = load_game()
-            if loaded:
-                print_success(msg)
-                return "load", {"state": loaded}
-            else:
-                print_error(msg)
-            continue
-        elif lower in ("help", "h", "?"):
-            print(HELP_TEXT)
-            continue
-        elif lower in ("quit", "exit"):
-            return "quit", None
         
-        # Handle numeric choice
-        try:
-            choice_num = int(user_input)
-            if choice_num in valid_ids:
-                for c in choices:
-                    if isinstance(c, dict) and c['id'] == choice_num:
-                        return "choice", c
-                # Fallback for simple lists
-                return "choice", {"id": choice_num, "text": str(choices[choice_num-1])}
-        except ValueError:
-            pass
+        # Handle numeric choice (checked up front - typos shouldn't cost a ValueError)
+        if user_input.isdecimal():
+            choice = choices_by_id.get(int(user_input))
+            if choice is not None:
+                return "choice", choice
         
         print_error(f"Invalid choice. Enter a number from the options above, or type 'help'.")
         print_choices(choices)
@@ -251,20 +404,46 @@ def get_choice(choices: list, state: GameState, dm: DungeonMaster) -> tuple[str,
 # GAME SETUP
 # =============================================================================
 
+# Static setup screens, joined once so each renders with a single write
+API_KEY_HELP = "\n".join([
+    "  To play, set your OpenRouter API key:",
+    "    Windows: set OPENROUTER_API_KEY=your_key_here",
+    "    Linux/Mac: export OPENROUTER_API_KEY=your_key_here",
+    "",
+    "  Get a free key at: https://openrouter.ai/keys",
+])
+
+CREATE_CHARACTER_HEADER = "\n".join([
+    "",
+    separator("═"),
+    "  CREATE YOUR CHARACTER",
+    separator("─"),
+])
+
+CLASS_MENU = "\n".join([
+    "",
+    "  Choose your class:",
+    "",
+    "    [1] FIGHTER - Strong and tough. Can heal in battle.",
+    "        HP: 18 | Primary: STR | Ability: Second Wind",
+    "",
+    "    [2] ROGUE - Quick and sneaky. Deadly precision strikes.",
+    "        HP: 12 | Primary: DEX | Ability: Sneak Attack",
+    "",
+    "    [3] MAGE - Powerful magic. Devastating spells.",
+    "        HP: 10 | Primary: INT | Ability: Fireball",
+])
+
 def setup_game() -> tuple[Optional[GameState], Optional[DungeonMaster]]:
     """Set up a new game or load an existing one."""
     clear_screen()
-    print(GAME_TITLE)
+    write_banner(GAME_TITLE_BYTES)
     
     # Check API key
     has_key, key_msg = check_api_key()
     if not has_key:
         print_error(key_msg)
-        print("  To play, set your OpenRouter API key:")
-        print("    Windows: set OPENROUTER_API_KEY=your_key_here")
-        print("    Linux/Mac: export OPENROUTER_API_KEY=your_key_here")
-        print()
-        print("  Get a free key at: https://openrouter.ai/keys")
+        print(API_KEY_HELP)
         print()
         input("  Press Enter to exit...")
         return None, None
@@ -286,13 +465,11 @@ def setup_game() -> tuple[Optional[GameState], Optional[DungeonMaster]]:
         
         while True:
             model_choice = get_input("  Select model (1-6): ")
-            try:
+            if model_choice.isdecimal():
                 idx = int(model_choice) - 1
                 if 0 <= idx < len(models):
                     selected_model = models[idx][0]
                     break
-            except ValueError:
-                pass
             print_error("Invalid choice")
     
     # Create DM
@@ -317,7 +494,7 @@ def setup_game() -> tuple[Optional[GameState], Optional[DungeonMaster]]:
             print()
             save_choice = get_input("  Load which save? (1-N or filename): ")
             
-            try:
+            if save_choice.isdecimal():
                 idx = int(save_choice) - 1
                 if 0 <= idx < len(saves):
                     loaded, msg = load_game(saves[idx])
@@ -326,7 +503,7 @@ def setup_game() -> tuple[Optional[GameState], Optional[DungeonMaster]]:
                         return loaded, dm
                     else:
                         print_error(msg)
-            except ValueError:
+            else:
                 loaded, msg = load_game(save_choice)
                 if loaded:
                     print_success(msg)
@@ -335,27 +512,14 @@ def setup_game() -> tuple[Optional[GameState], Optional[DungeonMaster]]:
                     print_error(msg)
     
     # Character creation
-    print()
-    print_separator("═")
-    print("  CREATE YOUR CHARACTER")
-    print_separator("─")
+    print(CREATE_CHARACTER_HEADER)
     print()
     
     name = get_input("  Enter your name: ")
     if not name:
         name = "Adventurer"
     
-    print()
-    print("  Choose your class:")
-    print()
-    print("    [1] FIGHTER - Strong and tough. Can heal in battle.")
-    print("        HP: 18 | Primary: STR | Ability: Second Wind")
-    print()
-    print("    [2] ROGUE - Quick and sneaky. Deadly precision strikes.")
-    print("        HP: 12 | Primary: DEX | Ability: Sneak Attack")
-    print()
-    print("    [3] MAGE - Powerful magic. Devastating spells.")
-    print("        HP: 10 | Primary: INT | Ability: Fireball")
+    print(CLASS_MENU)
     print()
     
     while True:
@@ -395,7 +559,7 @@ def run_combat(state: GameState, dm: DungeonMaster, enemy_data: dict) -> bool:
     """
     # Create enemy
     enemy = create_enemy_from_llm(enemy_data)
-    state.current_enemy = enemy.to_dict()
+    state.current_enemy = enemy
     state.in_combat = True
     state.sneak_attack_available = True
     
@@ -413,7 +577,6 @@ def run_combat(state: GameState, dm: DungeonMaster, enemy_data: dict) -> bool:
     
     while True:
         turn += 1
-        enemy = Enemy.from_dict(state.current_enemy)
         
         # Show combat status
         print_combat_status(state, enemy)
@@ -429,8 +592,7 @@ def run_combat(state: GameState, dm: DungeonMaster, enemy_data: dict) -> bool:
             choices.append({"id": 2, "text": f"Use {ability['name']} ({state.ability_uses} left)"})
         
         # Items
-        usable_items = [item for item in state.inventory 
-                       if item in ITEMS and ITEMS[item].get("type") == "consumable"]
+        usable_items = state.get_usable_items()
         if usable_items:
             choices.append({"id": 3, "text": f"Use Item ({len(usable_items)} available)"})
         
@@ -487,7 +649,7 @@ def run_combat(state: GameState, dm: DungeonMaster, enemy_data: dict) -> bool:
                 print(f"    [{i}] {item}")
             print()
             item_choice = get_input("  Item number: ")
-            try:
+            if item_choice.isdecimal():
                 idx = int(item_choice) - 1
                 if 0 <= idx < len(usable_items):
                     success, msg = use_item(state, usable_items[idx])
@@ -501,7 +663,7 @@ def run_combat(state: GameState, dm: DungeonMaster, enemy_data: dict) -> bool:
                 else:
                     print_error("Invalid item")
                     continue
-            except ValueError:
+            else:
                 print_error("Invalid choice")
                 continue
                 
@@ -541,7 +703,6 @@ def run_combat(state: GameState, dm: DungeonMaster, enemy_data: dict) -> bool:
                 return False
         
         # Enemy turn
-        enemy = Enemy.from_dict(state.current_enemy)  # Refresh after damage
         if enemy.hp > 0:
             print()
             print(f"  {enemy.name}'s turn...")
@@ -582,12 +743,62 @@ def run_combat(state: GameState, dm: DungeonMaster, enemy_data: dict) -> bool:
         
         print()
         input("  Press Enter to continue...")
-        clear_screen()
+        repaint_screen()
 
 # =============================================================================
 # MAIN GAME LOOP
 # =============================================================================
 
+def location_args(state: GameState, location: str) -> tuple:
+    """Arguments for dm.generate_location, snapshotted so they can be compared later."""
+    return (
+        location, state.name, state.player_class,
+        state.hp, state.max_hp, state.gold, list(state.inventory),
+        state.active_quest, state.recent_context,
+        dict(state.world_flags)
+    )
+
+def choice_args(state: GameState, location_name: str, choice_text: str,
+                choice_type: str, skill_check_result: str = "") -> tuple:
+    """Arguments for dm.generate_choice_result, snapshotted like location_args."""
+    return (
+        location_name, state.name, state.player_class,
+        state.hp, state.max_hp, state.gold, list(state.inventory),
+        state.active_quest, state.recent_context,
+        choice_text, choice_type, skill_check_result
+    )
+
+def speculate_choices(state: GameState, dm: DungeonMaster, location: dict, choices: list) -> dict:
+    """Start resolving up to SPECULATIVE_CHOICES explore choices; {choice id: (args, future)}."""
+    speculative = {}
+    if SPECULATIVE_CHOICES <= 0:
+        return speculative
+    # A choice behind a skill check depends on the roll, so it can't be resolved early
+    check_id = (location.get("requires_check") or {}).get("choice_id")
+    location_name = location.get("name", state.location)
+    for choice in choices:
+        if len(speculative) == SPECULATIVE_CHOICES:
+            break
+        if isinstance(choice, dict) and choice.get("type") == "explore" and choice.get("id") != check_id:
+            args = choice_args(state, location_name, choice.get("text", "continue"), "explore")
+            speculative[choice.get("id")] = (args, run_in_background(dm.generate_choice_result, *args))
+    return speculative
+
+def run_in_background(fn, *args) -> "Future":
+    """Run fn(*args) on a daemon thread (an abandoned LLM call never holds up exit)."""
+    # Imported here: concurrent.futures drags in logging, which the title screen doesn't need
+    from concurrent.futures import Future
+    future = Future()
+    
+    def worker() -> None:
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=worker, daemon=True).start()
+    return future
+
 def run_game(state: GameState, dm: DungeonMaster) -> None:
     """Main game loop."""
     
@@ -606,7 +817,7 @@ def run_game(state: GameState, dm: DungeonMaster) -> None:
         
         # Process opening
         state.location = opening.get("location_name", "The Rusty Tankard")
-        state.visited_locations.append(state.location)
+        state.mark_visited(state.location)
         
         # Set up main quest
         if "main_quest_hook" in opening:
@@ -624,18 +835,7 @@ def run_game(state: GameState, dm: DungeonMaster) -> None:
         print()
         # Display opening text with word wrap
         opening_text = opening.get("opening_text", "Your adventure begins...")
-        for para in opening_text.split("\n\n"):
-            words = para.split()
-            line = ""
-            for word in words:
-                if len(line) + len(word) + 1 > 74:
-                    print(f"  {line}")
-                    line = word
-                else:
-                    line = f"{line} {word}".strip()
-            if line:
-                print(f"  {line}")
-            print()
+        print_paragraphs(opening_text)
         
         choices = opening.get("choices", [
             {"id": 1, "text": "Look around", "type": "explore"}
@@ -652,12 +852,7 @@ def run_game(state: GameState, dm: DungeonMaster) -> None:
         clear_screen()
         print_dm_thinking()
         
-        success, location_data, error = dm.generate_location(
-            state.location, state.name, state.player_class,
-            state.hp, state.max_hp, state.gold, state.inventory,
-            state.active_quest, " | ".join(state.story_log[-3:]),
-            state.world_flags
-        )
+        success, location_data, error = dm.generate_location(*location_args(state, state.location))
         
         current_location = location_data
         choices = location_data.get("choices", [
@@ -683,11 +878,12 @@ def run_game(state: GameState, dm: DungeonMaster) -> None:
         
         # Add rest option if injured
         if state.hp < state.max_hp:
-            rest_exists = any(c.get("type") == "rest" for c in choices if isinstance(c, dict))
-            if not rest_exists:
+            choice_types = {c.get("type") for c in choices if isinstance(c, dict)}
+            if "rest" not in choice_types:
                 choices.append({"id": len(choices) + 1, "text": "Rest and recover", "type": "rest"})
         
         print_choices(choices)
+        speculative = speculate_choices(state, dm, current_location, choices)
         
         # Get player choice
         action, choice_data = get_choice(choices, state, dm)
@@ -705,12 +901,7 @@ def run_game(state: GameState, dm: DungeonMaster) -> None:
                 state = choice_data["state"]
                 # Regenerate location
                 print_dm_thinking()
-                success, location_data, error = dm.generate_location(
-                    state.location, state.name, state.player_class,
-                    state.hp, state.max_hp, state.gold, state.inventory,
-                    state.active_quest, " | ".join(state.story_log[-3:]),
-                    state.world_flags
-                )
+                success, location_data, error = dm.generate_location(*location_args(state, state.location))
                 current_location = location_data
                 continue
         
@@ -748,59 +939,59 @@ def run_game(state: GameState, dm: DungeonMaster) -> None:
                 skill_check_result = f"{'SUCCESS' if success_check else 'FAILURE'}: {display}"
                 print()
         
-        # Generate result from DM
-        print_dm_thinking()
-        
-        success, result, error = dm.generate_choice_result(
-            current_location.get("name", state.location),
-            state.name, state.player_class,
-            state.hp, state.max_hp, state.gold, state.inventory,
-            state.active_quest, " | ".join(state.story_log[-3:]),
-            choice_text, choice_type, skill_check_result
-        )
+        # Generate result from DM, showing the narration as it streams in, unless it
+        # was already resolved while the player was deciding
+        args = choice_args(state, current_location.get("name", state.location),
+                           choice_text, choice_type, skill_check_result)
+        spec_args, spec_future = speculative.get(choice_data.get("id"), (None, None))
+        if spec_future is not None and spec_args == args:
+            if not spec_future.done():
+                print_dm_thinking()
+            success, result, error = spec_future.result()
+            streamed = None
+        else:
+            print_dm_thinking()
+            streamer = StreamingPrinter()
+            success, result, error = dm.generate_choice_result(*args, on_narration=streamer.write)
+            streamed = streamer.finish()
         
         if not success:
             print_error(f"DM hiccup: {error}")
             print("  (Using fallback content)")
         
-        clear_screen()
-        print()
-        
-        # Display narration
+        # Display narration (unless it already streamed onto the screen)
         narration = result.get("narration", "You continue on your journey...")
-        words = narration.split()
-        line = ""
-        for word in words:
-            if len(line) + len(word) + 1 > 74:
-                print(f"  {line}")
-                line = word
-            else:
-                line = f"{line} {word}".strip()
-        if line:
-            print(f"  {line}")
+        if streamed != narration:
+            clear_screen()
+            print()
+            print_wrapped(narration)
         print()
         
+        new_location = result.get("new_location")
+        triggers_combat = result.get("triggers_combat")
+        
         # Process rewards
-        if result.get("items_found"):
-            for item in result["items_found"]:
-                state.add_to_inventory(item)
-                print(f"  [Found: {item}]")
+        for item in result.get("items_found") or ():
+            state.add_to_inventory(item)
+            print(f"  [Found: {item}]")
         
-        if result.get("gold_found", 0) > 0:
-            state.add_gold(result["gold_found"])
-            print(f"  [+{result['gold_found']} gold]")
+        gold_found = result.get("gold_found", 0)
+        if gold_found > 0:
+            state.add_gold(gold_found)
+            print(f"  [+{gold_found} gold]")
         
         # Process quest updates
-        if result.get("quest_update"):
-            qu = result["quest_update"]
+        qu = result.get("quest_update")
+        if qu:
             state.add_quest(qu.get("quest_id", "side_quest"), {
                 "name": qu.get("name", "New Quest"),
                 "description": qu.get("description", ""),
                 "status": qu.get("status", "active")
             })
-            if qu.get("status") == "started":
+            quest_status = qu.get("status")
+            if quest_status == "started":
                 print(f"  [Quest Started: {qu.get('name')}]")
-            elif qu.get("status") == "completed":
+            elif quest_status == "completed":
                 print(f"  [Quest Completed: {qu.get('name')}!]")
                 state.complete_quest(qu.get("quest_id"))
         
@@ -811,51 +1002,71 @@ def run_game(state: GameState, dm: DungeonMaster) -> None:
         # Log event
         state.log_event(f"{choice_text} -> {narration[:50]}...")
         
+        # Choices for the next turn usually come back with the result (some models
+        # name the key "choices"), which makes a separate generate_location unnecessary
+        follow_ups = result.get("follow_up_choices") or result.get("choices")
+        
+        # Roll for a random encounter from location data now, so the enemy is
+        # generated while the player reads rather than after they press Enter
+        scripted_fight = triggers_combat and result.get("enemy")
+        encounter = None
+        if not scripted_fight and current_location.get("possible_encounter"):
+            enc = current_location["possible_encounter"]
+            if random.random() < enc.get("chance", 0):
+                encounter = run_in_background(
+                    dm.generate_enemy,
+                    state.location,
+                    2,  # Medium difficulty
+                    enc.get("enemy_type", "wandering creature"),
+                    state.recent_context
+                )
+        
+        # Start on the next location while the player reads. Skipped when a fight
+        # is certain, since it changes HP and the log the prompt is built from.
+        prefetch = prefetch_args = None
+        if not follow_ups and not triggers_combat and encounter is None:
+            prefetch_args = location_args(state, new_location or state.location)
+            prefetch = run_in_background(dm.generate_location, *prefetch_args)
+        
         input("  Press Enter to continue...")
         
         # Check for combat trigger
-        if result.get("triggers_combat") and result.get("enemy"):
+        if scripted_fight:
             won = run_combat(state, dm, result["enemy"])
             if state.game_over:
                 break
         
-        # Check for random encounter from location data
-        elif current_location.get("possible_encounter"):
-            enc = current_location["possible_encounter"]
-            if random.random() < enc.get("chance", 0):
-                # Generate enemy
+        # Fight the random encounter rolled above
+        elif encounter is not None:
+            if not encounter.done():
                 print_dm_thinking()
-                success, enemy_data, _ = dm.generate_enemy(
-                    state.location,
-                    2,  # Medium difficulty
-                    enc.get("enemy_type", "wandering creature"),
-                    " | ".join(state.story_log[-3:])
-                )
-                won = run_combat(state, dm, enemy_data)
-                if state.game_over:
-                    break
+            success, enemy_data, _ = encounter.result()
+            won = run_combat(state, dm, enemy_data)
+            if state.game_over:
+                break
         
         # Update location
-        if result.get("new_location"):
-            state.location = result["new_location"]
-            state.visited_locations.append(state.location)
+        if new_location:
+            state.location = new_location
+            state.mark_visited(state.location)
         
         # Generate new location or use follow-up choices
-        if result.get("follow_up_choices"):
+        if follow_ups:
             current_location = {
-                "name": current_location.get("name", state.location),
+                "name": new_location or current_location.get("name", state.location),
                 "description": narration,
-                "choices": result["follow_up_choices"]
+                "choices": follow_ups
             }
         else:
-            # Generate new location content
-            print_dm_thinking()
-            success, location_data, error = dm.generate_location(
-                state.location, state.name, state.player_class,
-                state.hp, state.max_hp, state.gold, state.inventory,
-                state.active_quest, " | ".join(state.story_log[-3:]),
-                state.world_flags
-            )
+            # Generate new location content, reusing the prefetch if the state still matches
+            args = location_args(state, state.location)
+            if prefetch is not None and prefetch_args == args:
+                if not prefetch.done():
+                    print_dm_thinking()
+                success, location_data, error = prefetch.result()
+            else:
+                print_dm_thinking()
+                success, location_data, error = dm.generate_location(*args)
             current_location = location_data
     
     # Game over
@@ -877,7 +1088,7 @@ def show_ending(state: GameState, dm: DungeonMaster) -> None:
     if state.gold > 100:
         achievements.append("Amassed a fortune")
     
-    major_choices = list(state.story_log[-5:])
+    major_choices = state.recent_events(5)
     
     print_dm_thinking()
     success, ending, error = dm.generate_ending(
@@ -889,31 +1100,24 @@ def show_ending(state: GameState, dm: DungeonMaster) -> None:
         ending_type
     )
     
+    title = ending.get("title", "THE END")
+    epilogue = ending.get("epilogue", "And so the adventure ends...")
+    final_stats = ending.get("final_stats", f"Gold: {state.gold} | Turns: {state.turn_count}")
+    credits_note = ending.get("credits_note", "Thanks for playing!")
+    
     print()
     print_separator("═")
-    print(f"  {ending.get('title', 'THE END').upper()}")
+    print(f"  {title.upper()}")
     print_separator("═")
     print()
     
-    epilogue = ending.get("epilogue", "And so the adventure ends...")
-    for para in epilogue.split("\n"):
-        words = para.split()
-        line = ""
-        for word in words:
-            if len(line) + len(word) + 1 > 74:
-                print(f"  {line}")
-                line = word
-            else:
-                line = f"{line} {word}".strip()
-        if line:
-            print(f"  {line}")
-        print()
+    print_paragraphs(epilogue, "\n")
     
     print_separator("─")
-    print(f"  {ending.get('final_stats', f'Gold: {state.gold} | Turns: {state.turn_count}')}")
+    print(f"  {final_stats}")
     print_separator("─")
     print()
-    print(f"  {ending.get('credits_note', 'Thanks for playing!')}")
+    print(f"  {credits_note}")
     print()
     print_separator("═")
     print()
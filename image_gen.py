@@ -7,8 +7,11 @@ We use their simple URL-based API for generating scene and enemy images.
 """
 
 import urllib.parse
+import urllib.request
+import urllib.error
 import hashlib
 import os
+from functools import lru_cache
 
 # =============================================================================
 # CONFIGURATION
@@ -31,10 +34,49 @@ ENEMY_STYLE = "dark fantasy creature portrait, menacing, dramatic pose, dark bac
 # Cache directory for generated images (optional optimization)
 CACHE_DIR = "static/generated"
 
+# Generated URLs are deterministic (seeded from the prompt), so repeat
+# prompts - revisited locations, recurring enemies - are served from memory
+IMAGE_CACHE_SIZE = 512
+
+# Style hints per location type
+LOCATION_STYLES = {
+    "tavern": "cozy medieval tavern interior, fireplace, wooden beams, candlelight",
+    "forest": "dark enchanted forest path, twisted trees, mysterious fog, moonlight",
+    "dungeon": "underground dungeon corridor, stone walls, torches, ancient ruins",
+    "castle": "gothic castle interior, grand halls, stained glass, dramatic shadows",
+    "cave": "deep cave system, stalactites, bioluminescent fungi, underground lake",
+    "town": "medieval town square, cobblestone streets, timber buildings, market stalls",
+    "ruins": "ancient temple ruins, overgrown vines, crumbling pillars, mystical glow",
+    "swamp": "murky swamp, dead trees, fog, eerie atmosphere, will-o-wisps",
+    "mountain": "treacherous mountain pass, snow, cliff edges, storm clouds",
+    "crypt": "underground crypt, sarcophagi, cobwebs, ghostly presence"
+}
+
+ITEM_STYLES = {
+    "weapon": "fantasy weapon, detailed metalwork, ornate handle",
+    "armor": "fantasy armor piece, detailed craftsmanship, battle-worn",
+    "potion": "magical potion bottle, glowing liquid, mystical",
+    "key": "ornate fantasy key, ancient, magical runes",
+    "scroll": "ancient scroll, magical symbols, glowing text",
+    "ring": "magical ring, gemstone, enchanted glow",
+    "amulet": "mystical amulet, ancient symbols, magical energy"
+}
+
+CLASS_STYLES = {
+    "fighter": "armored warrior, battle-scarred, determined expression, sword and shield",
+    "rogue": "hooded rogue, daggers, mysterious, shadows, cunning eyes",
+    "mage": "powerful wizard, magical staff, arcane symbols, mystical aura"
+}
+
+def prompt_seed(text: str) -> int:
+    """Stable seed for a prompt (same text -> same image)."""
+    return int.from_bytes(hashlib.blake2s(text.encode(), digest_size=4).digest(), "big") % 1000000
+
 # =============================================================================
 # IMAGE GENERATION
 # =============================================================================
 
+@lru_cache(maxsize=IMAGE_CACHE_SIZE)
 def generate_image_url(prompt: str, width: int = DEFAULT_WIDTH, 
                        height: int = DEFAULT_HEIGHT, seed: int = None) -> str:
     """
@@ -50,8 +92,7 @@ def generate_image_url(prompt: str, width: int = DEFAULT_WIDTH,
         URL string that will generate the image when loaded
     """
     # Clean and encode the prompt
-    full_prompt = prompt.strip()
-    encoded_prompt = urllib.parse.quote(full_prompt)
+    encoded_prompt = urllib.parse.quote_from_bytes(prompt.strip().encode())
     
     # Build URL with parameters
     url = f"https://image.pollinations.ai/prompt/{encoded_prompt}"
@@ -72,6 +113,7 @@ def generate_image_url(prompt: str, width: int = DEFAULT_WIDTH,
     
     return url
 
+@lru_cache(maxsize=IMAGE_CACHE_SIZE)
 def generate_scene_image(description: str, location_type: str = None) -> str:
     """
     Generate an image URL for a scene/location.
@@ -83,34 +125,19 @@ def generate_scene_image(description: str, location_type: str = None) -> str:
     Returns:
         Pollinations.ai URL for the scene image
     """
-    # Build the prompt
-    prompt = description
-    
-    # Add style modifiers based on location type
-    if location_type:
-        location_styles = {
-            "tavern": "cozy medieval tavern interior, fireplace, wooden beams, candlelight",
-            "forest": "dark enchanted forest path, twisted trees, mysterious fog, moonlight",
-            "dungeon": "underground dungeon corridor, stone walls, torches, ancient ruins",
-            "castle": "gothic castle interior, grand halls, stained glass, dramatic shadows",
-            "cave": "deep cave system, stalactites, bioluminescent fungi, underground lake",
-            "town": "medieval town square, cobblestone streets, timber buildings, market stalls",
-            "ruins": "ancient temple ruins, overgrown vines, crumbling pillars, mystical glow",
-            "swamp": "murky swamp, dead trees, fog, eerie atmosphere, will-o-wisps",
-            "mountain": "treacherous mountain pass, snow, cliff edges, storm clouds",
-            "crypt": "underground crypt, sarcophagi, cobwebs, ghostly presence"
-        }
-        if location_type.lower() in location_styles:
-            prompt = f"{location_styles[location_type.lower()]}, {description}"
-    
-    # Add consistent style
-    prompt = f"{prompt}, {SCENE_STYLE}"
+    # Build the prompt, with style modifiers based on location type
+    style = LOCATION_STYLES.get(location_type.lower()) if location_type else None
+    if style:
+        prompt = f"{style}, {description}, {SCENE_STYLE}"
+    else:
+        prompt = f"{description}, {SCENE_STYLE}"
     
     # Generate consistent seed from description for caching
-    seed = int(hashlib.md5(description.encode()).hexdigest()[:8], 16) % 1000000
+    seed = prompt_seed(description)
     
     return generate_image_url(prompt, DEFAULT_WIDTH, DEFAULT_HEIGHT, seed)
 
+@lru_cache(maxsize=IMAGE_CACHE_SIZE)
 def generate_enemy_image(enemy_name: str, description: str = "") -> str:
     """
     Generate an image URL for an enemy/creature.
@@ -132,7 +159,7 @@ def generate_enemy_image(enemy_name: str, description: str = "") -> str:
     prompt = f"{prompt}, {ENEMY_STYLE}"
     
     # Generate consistent seed from name for caching
-    seed = int(hashlib.md5(enemy_name.encode()).hexdigest()[:8], 16) % 1000000
+    seed = prompt_seed(enemy_name)
     
     return generate_image_url(prompt, 768, 768, seed)  # Square for portraits
 
@@ -147,20 +174,10 @@ def generate_item_image(item_name: str, item_type: str = "item") -> str:
     Returns:
         Pollinations.ai URL for the item image
     """
-    type_styles = {
-        "weapon": "fantasy weapon, detailed metalwork, ornate handle",
-        "armor": "fantasy armor piece, detailed craftsmanship, battle-worn",
-        "potion": "magical potion bottle, glowing liquid, mystical",
-        "key": "ornate fantasy key, ancient, magical runes",
-        "scroll": "ancient scroll, magical symbols, glowing text",
-        "ring": "magical ring, gemstone, enchanted glow",
-        "amulet": "mystical amulet, ancient symbols, magical energy"
-    }
-    
-    style = type_styles.get(item_type.lower(), "fantasy item, detailed")
+    style = ITEM_STYLES.get(item_type.lower(), "fantasy item, detailed")
     prompt = f"{item_name}, {style}, dark background, studio lighting, game item icon style"
     
-    seed = int(hashlib.md5(item_name.encode()).hexdigest()[:8], 16) % 1000000
+    seed = prompt_seed(item_name)
     
     return generate_image_url(prompt, 256, 256, seed)
 
@@ -175,20 +192,31 @@ def generate_character_portrait(name: str, player_class: str) -> str:
     Returns:
         Pollinations.ai URL for the character portrait
     """
-    class_styles = {
-        "fighter": "armored warrior, battle-scarred, determined expression, sword and shield",
-        "rogue": "hooded rogue, daggers, mysterious, shadows, cunning eyes",
-        "mage": "powerful wizard, magical staff, arcane symbols, mystical aura"
-    }
-    
-    style = class_styles.get(player_class.lower(), "fantasy adventurer")
+    style = CLASS_STYLES.get(player_class.lower(), "fantasy adventurer")
     prompt = f"fantasy character portrait, {style}, {STYLE_SUFFIX}"
     
     # Use name for seed so same character gets same portrait
-    seed = int(hashlib.md5(f"{name}_{player_class}".encode()).hexdigest()[:8], 16) % 1000000
+    seed = prompt_seed(f"{name}_{player_class}")
     
     return generate_image_url(prompt, 512, 512, seed)
 
+def prewarm_image(url: str, timeout: int = 60) -> bool:
+    """
+    Request an image URL so Pollinations renders and caches it ahead of the browser.
+    
+    Args:
+        url: Image URL from one of the generate_* functions
+        timeout: Seconds to wait for the render
+    
+    Returns:
+        True if the image is ready, False on any network error
+    """
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return response.status == 200
+    except (urllib.error.URLError, OSError):
+        return False
+
 # =============================================================================
 # TESTING
 # =============================================================================
@@ -19,12 +19,26 @@ To add new models:
 """
 
 import os
+import re
 import json
-import urllib.request
-import urllib.error
-from typing import Optional, Any
+import copy
+import time
+import random
+import hashlib
+import http.client
+import threading
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from itertools import islice
+from urllib.parse import urlsplit
+from typing import Optional, Any, Callable
 from dataclasses import dataclass
 
+try:
+    import orjson  # Optional: faster request/response JSON
+except ImportError:
+    orjson = None
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -40,6 +54,48 @@ def debug_log(message: str) -> None:
 OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
 DEFAULT_MODEL = "google/gemini-2.5-flash"
 
+# Successful responses are memoized process-wide (the web app builds a DM per
+# request), keyed on the inputs that shape the content, so revisits reuse one
+# LLM response instead of paying another round-trip
+RESPONSE_CACHE_SIZE = 512
+NARRATION_HP_BUCKET = 5  # Combat narration treats HP within 5 points as the same
+_response_cache: OrderedDict = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+# Per-turn prompt context is held to a fixed budget so prefill stays flat as
+# the game grows (~4 characters per token)
+CONTEXT_EVENT_CHARS = 80      # Each recent story event
+CONTEXT_INVENTORY_ITEMS = 8   # Distinct items listed; the rest are counted
+CONTEXT_FLAG_COUNT = 12       # Most recently set world flags
+
+# Reply length caps per DM call, sized to each JSON shape with headroom - a
+# reply cut off at the cap is a failure and is retried with double the cap
+MAX_TOKENS = {
+    "story_start": 1000,
+    "location": 600,
+    "choice_result": 900,
+    "combat_narration": 300,
+    "enemy": 400,
+    "ending": 1000
+}
+
+# Retries after rate limits, server errors and dropped connections wait a random
+# 0..RETRY_BACKOFF * 2**attempt seconds; these statuses won't change on a retry
+RETRY_BACKOFF = 0.5
+NON_RETRYABLE_STATUS = frozenset({401, 402, 403, 404})
+
+# Optional cheap "drafter" (e.g. google/gemini-2.0-flash-lite) tried first on
+# routine turns, combat narration and enemy stat blocks; the selected model only
+# runs if the draft fails validation. Off unless DM_DRAFT_MODEL is set, so the
+# model the player picked is the one that answers by default.
+DRAFT_MODEL = os.environ.get("DM_DRAFT_MODEL", "")
+
+# Optional OpenAI-compatible local server (llama.cpp, Ollama) asked after the API
+# gives up and before the canned fallback content, e.g.
+# http://localhost:11434/v1/chat/completions. Empty to skip.
+LOCAL_MODEL_URL = os.environ.get("DM_LOCAL_MODEL_URL", "")
+LOCAL_MODEL = os.environ.get("DM_LOCAL_MODEL", "llama3.2")
+
 # Available models with descriptions
 AVAILABLE_MODELS = {
     # === BALANCED (Default tier - great value) ===
@@ -145,18 +201,11 @@ QUEST DESIGN:
 # =============================================================================
 # PROMPT TEMPLATES
 # =============================================================================
+# Static instructions and the JSON schema come first and per-call state comes
+# last, so repeated calls share a byte-identical prefix that providers can cache.
 
 LOCATION_PROMPT = """Generate a location scene for the player.
 
-CURRENT STATE:
-- Location type: {location_type}
-- Player: {player_name} the {player_class}
-- HP: {hp}/{max_hp}, Gold: {gold}
-- Inventory: {inventory}
-- Active quest: {active_quest}
-- Recent events: {story_summary}
-- World flags: {world_flags}
-
 REQUIREMENTS:
 - Create an atmospheric 2-3 sentence description
 - Provide 3-5 meaningful choices
@@ -175,21 +224,18 @@ Respond with this exact JSON structure:
     "requires_check": {{"skill": "STR|DEX|INT|CHA", "dc": 10-18, "choice_id": 1}} or null,
     "hidden_info": {{"key": "value"}} or null,
     "possible_encounter": {{"chance": 0.0-0.3, "enemy_type": "..."}} or null
-}}"""
-
-CHOICE_RESULT_PROMPT = """The player made a choice. Generate the result.
+}}
 
 CURRENT STATE:
-- Location: {location_name}
+- Location type: {location_type}
 - Player: {player_name} the {player_class}
 - HP: {hp}/{max_hp}, Gold: {gold}
 - Inventory: {inventory}
 - Active quest: {active_quest}
 - Recent events: {story_summary}
+- World flags: {world_flags}"""
 
-PLAYER'S CHOICE: {choice_text}
-CHOICE TYPE: {choice_type}
-{skill_check_result}
+CHOICE_RESULT_PROMPT = """The player made a choice. Generate the result.
 
 REQUIREMENTS:
 - Describe what happens (2-3 sentences)
@@ -197,11 +243,12 @@ REQUIREMENTS:
 - If this triggers combat, provide enemy data
 - If this advances a quest, note the progress
 - Include consequences that feel meaningful
+- Always provide 3-5 follow-up choices for what the player can do next
 
 Respond with this exact JSON structure:
 {{
     "narration": "What happens as a result of this choice",
-    "new_location": "location_id" or null,
+    "new_location": "Name of the new place" or null,
     "triggers_combat": false,
     "enemy": {{"name": "...", "hp": 10-50, "ac": 10-16, "attack_bonus": 1-5, "damage_dice": [1, 6], "damage_bonus": 1-3, "behavior": "aggressive|defensive", "description": "...", "xp": 20-100, "gold_drop": [1, 10], "loot": []}} or null,
     "items_found": ["item1", "item2"] or [],
@@ -209,21 +256,25 @@ Respond with this exact JSON structure:
     "quest_update": {{"quest_id": "...", "status": "started|progressed|completed", "name": "...", "description": "..."}} or null,
     "flag_changes": {{"flag_name": value}} or {{}},
     "requires_another_check": {{"skill": "...", "dc": ..., "for": "description"}} or null,
-    "follow_up_choices": [...] or null
-}}"""
+    "follow_up_choices": [
+        {{"id": 1, "text": "Choice text", "type": "explore|talk|combat|rest|quest"}},
+        ...
+    ]
+}}
 
-COMBAT_NARRATION_PROMPT = """Narrate this combat exchange.
+CURRENT STATE:
+- Location: {location_name}
+- Player: {player_name} the {player_class}
+- HP: {hp}/{max_hp}, Gold: {gold}
+- Inventory: {inventory}
+- Active quest: {active_quest}
+- Recent events: {story_summary}
 
-COMBAT STATE:
-- Player: {player_name} the {player_class}, HP: {hp}/{max_hp}
-- Enemy: {enemy_name}, HP: {enemy_hp}/{enemy_max_hp}
-- Turn: {turn_number}
+PLAYER'S CHOICE: {choice_text}
+CHOICE TYPE: {choice_type}
+{skill_check_result}"""
 
-LAST ACTIONS:
-- Player action: {player_action}
-- Player result: {player_result}
-- Enemy action: {enemy_action}  
-- Enemy result: {enemy_result}
+COMBAT_NARRATION_PROMPT = """Narrate this combat exchange.
 
 REQUIREMENTS:
 - Write 1-2 punchy sentences describing the exchange
@@ -237,15 +288,20 @@ Respond with this exact JSON structure:
     "player_status": "fighting|wounded|desperate|victorious|defeated",
     "enemy_status": "fighting|wounded|desperate|defeated",
     "tactical_hint": "Optional hint for player" or null
-}}"""
+}}
 
-ENEMY_GENERATION_PROMPT = """Generate an enemy for this encounter.
+COMBAT STATE:
+- Player: {player_name} the {player_class}, HP: {hp}/{max_hp}
+- Enemy: {enemy_name}, HP: {enemy_hp}/{enemy_max_hp}
+- Turn: {turn_number}
 
-CONTEXT:
-- Location: {location_type}
-- Player level equivalent: {player_power}
-- Situation: {situation}
-- Story context: {story_summary}
+LAST ACTIONS:
+- Player action: {player_action}
+- Player result: {player_result}
+- Enemy action: {enemy_action}  
+- Enemy result: {enemy_result}"""
+
+ENEMY_GENERATION_PROMPT = """Generate an enemy for this encounter.
 
 REQUIREMENTS:
 - Enemy should be appropriate for the location
@@ -266,14 +322,15 @@ Respond with this exact JSON structure:
     "xp": 20-150,
     "gold_drop": [min, max],
     "loot": ["possible item 1", "possible item 2"]
-}}"""
+}}
 
-STORY_START_PROMPT = """Create the opening scene for a new adventure.
+CONTEXT:
+- Location: {location_type}
+- Player level equivalent: {player_power}
+- Situation: {situation}
+- Story context: {story_summary}"""
 
-PLAYER:
-- Name: {player_name}
-- Class: {player_class}
-- Starting items: {inventory}
+STORY_START_PROMPT = """Create the opening scene for a new adventure.
 
 REQUIREMENTS:
 - Set the scene in a classic tavern setting
@@ -298,18 +355,14 @@ Respond with this exact JSON structure:
         {{"id": 1, "text": "Choice", "type": "talk|explore|quest"}},
         ...
     ]
-}}"""
+}}
 
-ENDING_PROMPT = """Generate an ending for the adventure.
+PLAYER:
+- Name: {player_name}
+- Class: {player_class}
+- Starting items: {inventory}"""
 
-FINAL STATE:
-- Player: {player_name} the {player_class}
-- HP: {hp}/{max_hp}
-- Gold: {gold}
-- Key achievements: {achievements}
-- Quests completed: {quests}
-- Major choices: {major_choices}
-- Ending type: {ending_type}
+ENDING_PROMPT = """Generate an ending for the adventure.
 
 REQUIREMENTS:
 - Write a satisfying 2-3 paragraph epilogue
@@ -323,7 +376,182 @@ Respond with this exact JSON structure:
     "epilogue": "2-3 paragraph ending narration",
     "final_stats": "Brief summary of the adventure",
     "credits_note": "A fun closing line"
-}}"""
+}}
+
+FINAL STATE:
+- Player: {player_name} the {player_class}
+- HP: {hp}/{max_hp}
+- Gold: {gold}
+- Key achievements: {achievements}
+- Quests completed: {quests}
+- Major choices: {major_choices}
+- Ending type: {ending_type}"""
+
+# =============================================================================
+# RESPONSE SCHEMAS
+# =============================================================================
+
+# JSON schemas for the per-turn replies, sent as response_format to models that
+# support structured output so the reply parses on the first try. Not strict:
+# flag_changes and hidden_info are free-form objects, which strict mode forbids.
+# Value hints live in the descriptions, since the example JSON is left out of
+# the prompt whenever a schema is sent. Fields that may be absent are simply not
+# required - ["object", "null"] unions are rejected by some providers.
+_CHOICE_ITEM = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "text": {"type": "string"},
+        "type": {"type": "string", "enum": ["explore", "talk", "combat", "rest", "quest"]}
+    },
+    "required": ["id", "text", "type"]
+}
+_CHOICE_LIST = {"type": "array", "items": _CHOICE_ITEM, "minItems": 3, "maxItems": 5}
+
+_ENEMY = {
+    "type": "object",
+    "description": "Only when triggers_combat is true",
+    "properties": {
+        "name": {"type": "string"},
+        "hp": {"type": "integer", "description": "10-50"},
+        "ac": {"type": "integer", "description": "10-16"},
+        "attack_bonus": {"type": "integer", "description": "1-5"},
+        "damage_dice": {"type": "array", "items": {"type": "integer"}, "description": "[count, sides], e.g. [1, 6]"},
+        "damage_bonus": {"type": "integer", "description": "1-3"},
+        "behavior": {"type": "string", "enum": ["aggressive", "defensive"]},
+        "description": {"type": "string"},
+        "xp": {"type": "integer", "description": "20-100"},
+        "gold_drop": {"type": "array", "items": {"type": "integer"}, "description": "[min, max], e.g. [1, 10]"},
+        "loot": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["name", "hp", "ac", "attack_bonus", "damage_dice", "damage_bonus", "description"]
+}
+
+LOCATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "location_name": {"type": "string", "description": "Name of this place"},
+        "description": {"type": "string", "description": "2-3 sentence atmospheric description"},
+        "choices": _CHOICE_LIST,
+        "requires_check": {
+            "type": "object",
+            "properties": {
+                "skill": {"type": "string", "enum": ["STR", "DEX", "INT", "CHA"]},
+                "dc": {"type": "integer", "description": "10-18"},
+                "choice_id": {"type": "integer"}
+            }
+        },
+        "hidden_info": {"type": "object"},
+        "possible_encounter": {
+            "type": "object",
+            "properties": {
+                "chance": {"type": "number", "description": "0.0-0.3"},
+                "enemy_type": {"type": "string"}
+            }
+        }
+    },
+    "required": ["location_name", "description", "choices"]
+}
+
+CHOICE_RESULT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "narration": {"type": "string", "description": "What happens as a result of this choice"},
+        "new_location": {"type": "string", "description": "Name of the new place - omit if the player stays"},
+        "triggers_combat": {"type": "boolean"},
+        "enemy": _ENEMY,
+        "items_found": {"type": "array", "items": {"type": "string"}},
+        "gold_found": {"type": "integer"},
+        "quest_update": {
+            "type": "object",
+            "properties": {
+                "quest_id": {"type": "string"},
+                "status": {"type": "string", "enum": ["started", "progressed", "completed"]},
+                "name": {"type": "string"},
+                "description": {"type": "string"}
+            }
+        },
+        "flag_changes": {"type": "object", "description": "{flag_name: value}"},
+        "requires_another_check": {
+            "type": "object",
+            "properties": {
+                "skill": {"type": "string"},
+                "dc": {"type": "integer"},
+                "for": {"type": "string"}
+            }
+        },
+        "follow_up_choices": _CHOICE_LIST
+    },
+    "required": ["narration", "triggers_combat", "items_found", "gold_found", "follow_up_choices"]
+}
+
+# OpenRouter forwards response_format json_schema to these providers
+STRUCTURED_OUTPUT_PROVIDERS = ("openai/", "google/")
+
+# Models whose provider answered a schema request with HTTP 400 - they get plain
+# JSON prompts from then on instead of paying for a rejected request every call
+_schema_rejected_models: set = set()
+
+def supports_structured_output(model: str) -> bool:
+    """Whether a model accepts a JSON schema response_format through OpenRouter."""
+    return model.startswith(STRUCTURED_OUTPUT_PROVIDERS) and model not in _schema_rejected_models
+
+# =============================================================================
+# FALLBACK CONTENT
+# =============================================================================
+
+# Static parts of the offline fallbacks, shared rather than rebuilt on every call.
+# _call_with_retry hands out a deep copy, so callers may still edit what they get.
+FALLBACK_CHOICES = [
+    {"id": 1, "text": "Look around carefully", "type": "explore"},
+    {"id": 2, "text": "Move forward cautiously", "type": "explore"},
+    {"id": 3, "text": "Search for useful items", "type": "explore"},
+    {"id": 4, "text": "Rest for a moment", "type": "rest"}
+]
+
+OPENING_FALLBACK = {
+    "location_name": "The Rusty Tankard",
+    "main_quest_hook": {
+        "id": "main_quest",
+        "name": "The Missing Villagers",
+        "description": "Villagers have been disappearing near the old mill",
+        "rumors": ["Strange lights at night", "No bodies ever found"]
+    },
+    "npcs_present": [
+        {"name": "Gruff Bartender", "role": "bartender", "appearance": "tired, worried eyes"},
+        {"name": "Hooded Stranger", "role": "stranger", "appearance": "face hidden, watching"}
+    ],
+    "choices": [
+        {"id": 1, "text": "Talk to the bartender about the troubles", "type": "talk"},
+        {"id": 2, "text": "Approach the hooded stranger", "type": "talk"},
+        {"id": 3, "text": "Check the notice board", "type": "quest"},
+        {"id": 4, "text": "Order a drink and listen to conversations", "type": "explore"}
+    ]
+}
+
+# =============================================================================
+# PROMPT CACHING
+# =============================================================================
+
+# OpenAI, Gemini and DeepSeek reuse a repeated prompt prefix automatically.
+# Anthropic needs cache_control breakpoints, but only caches prefixes of
+# 1024+ tokens (2048 on Haiku) - longer than any system prompt + template
+# head here, so none are sent
+
+# Every template ends its JSON structure with an unindented "}" line before the
+# per-call state, so the first one marks the end of the static prefix
+PROMPT_STATE_BREAK = "\n}\n\n"
+
+# Opens each template's example JSON, which runs up to PROMPT_STATE_BREAK
+PROMPT_FORMAT_HEADER = "Respond with this exact JSON structure:\n"
+
+def strip_format_example(user_prompt: str) -> str:
+    """Drop the example JSON from a prompt whose reply format is set by a schema."""
+    start = user_prompt.find(PROMPT_FORMAT_HEADER)
+    end = user_prompt.find(PROMPT_STATE_BREAK, start)
+    if start == -1 or end == -1:
+        return user_prompt
+    return user_prompt[:start] + "Respond with JSON matching the response schema." + user_prompt[end + 2:]
 
 # =============================================================================
 # API CLIENT
@@ -337,6 +565,39 @@ class LLMResponse:
     raw_text: str
     error: Optional[str]
     model_used: str
+    status: int = 0  # HTTP status, 0 if no response arrived
+    finish_reason: str = ""  # "length" when the reply hit max_tokens
+
+# One keep-alive HTTPS connection per thread, so consecutive DM calls skip the
+# TCP + TLS handshake (http.client connections are not thread-safe to share)
+_API_URL = urlsplit(OPENROUTER_API_URL)
+_connections = threading.local()
+
+def _get_connection(timeout: int) -> http.client.HTTPSConnection:
+    """Return this thread's OpenRouter connection, opening one if needed."""
+    conn = getattr(_connections, "conn", None)
+    if conn is None:
+        conn = http.client.HTTPSConnection(_API_URL.hostname, _API_URL.port, timeout=timeout)
+        _connections.conn = conn
+    return conn
+
+def _drop_connection() -> None:
+    """Close this thread's connection so the next call reconnects."""
+    conn = getattr(_connections, "conn", None)
+    if conn is not None:
+        conn.close()
+        _connections.conn = None
+
+API_HEADERS = {
+    "Content-Type": "application/json",
+    "HTTP-Referer": "https://github.com/dnd-adventure",
+    "X-Title": "D&D Text Adventure"
+}
+
+@lru_cache(maxsize=8)
+def request_headers(api_key: str) -> dict:
+    """Request headers for an API key, built once per key (shared - never mutate)."""
+    return {"Authorization": f"Bearer {api_key}", **API_HEADERS}
 
 class OpenRouterClient:
     """Client for OpenRouter API using only standard library."""
@@ -359,29 +620,39 @@ class OpenRouterClient:
             debug_log(f"Unknown model: {model}, keeping {self.model}")
     
     def call(self, system_prompt: str, user_prompt: str, 
-             temperature: float = 0.8, max_tokens: int = 1000) -> LLMResponse:
+             temperature: float = 0.8, max_tokens: int = 1000,
+             model: Optional[str] = None,
+             on_delta: Optional[Callable[[str], None]] = None,
+             schema: Optional[dict] = None) -> LLMResponse:
         """
-        Make an API call to OpenRouter.
+        Make an API call to OpenRouter (with the client's model unless one is given).
+        With on_delta, the response is streamed and each text fragment is passed
+        to it as it arrives. A schema is sent as the response format when the
+        model supports structured output.
         Returns LLMResponse with parsed JSON content if possible.
         """
+        model = model or self.model
         if not self.api_key:
             return LLMResponse(
                 success=False,
                 content=None,
                 raw_text="",
                 error="No API key configured. Set OPENROUTER_API_KEY environment variable.",
-                model_used=self.model
+                model_used=model
             )
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/dnd-adventure",
-            "X-Title": "D&D Text Adventure"
-        }
+        headers = request_headers(self.api_key)
+        
+        response_format = None
+        if schema is not None and supports_structured_output(model):
+            response_format = {
+                "type": "json_schema",
+                "json_schema": {"name": "dm_response", "strict": False, "schema": schema}
+            }
+            user_prompt = strip_format_example(user_prompt)
         
         payload = {
-            "model": self.model,
+            "model": model,
             "messages": [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
@@ -389,25 +660,66 @@ class OpenRouterClient:
             "temperature": temperature,
             "max_tokens": max_tokens
         }
+        if on_delta is not None:
+            payload["stream"] = True
+        if response_format is not None:
+            payload["response_format"] = response_format
         
-        debug_log(f"API call to {self.model}")
-        debug_log(f"User prompt: {user_prompt[:200]}...")
+        if DEBUG:
+            debug_log(f"API call to {model}")
+            debug_log(f"User prompt: {user_prompt[:200]}...")
         
         try:
-            data = json.dumps(payload).encode("utf-8")
-            request = urllib.request.Request(
-                OPENROUTER_API_URL,
-                data=data,
-                headers=headers,
-                method="POST"
-            )
+            data = encode_json(payload)
+            if on_delta is None:
+                status, body = self._post(data, headers)
+                raw_text = None
+            else:
+                status, body, raw_text, finish_reason = self._post_stream(data, headers, on_delta)
+            
+            if status >= 400:
+                if status == 400 and response_format is not None:
+                    _schema_rejected_models.add(model)
+                error_msg = f"HTTP {status}: {body.decode('utf-8', 'replace')[:200]}"
+                self.last_error = error_msg
+                debug_log(f"API error: {error_msg}")
+                return LLMResponse(
+                    success=False,
+                    content=None,
+                    raw_text="",
+                    error=error_msg,
+                    model_used=model,
+                    status=status
+                )
             
-            with urllib.request.urlopen(request, timeout=30) as response:
-                result = json.loads(response.read().decode("utf-8"))
+            if raw_text is None:
+                result = decode_json(body)
+                
+                # Extract the message content
+                choice = result.get("choices", [{}])[0]
+                raw_text = choice.get("message", {}).get("content", "")
+                finish_reason = choice.get("finish_reason") or ""
+                if DEBUG:
+                    usage = result.get("usage") or {}
+                    cached = (usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0)
+                    debug_log(f"Prompt tokens: {usage.get('prompt_tokens')} ({cached} cached)")
+            if DEBUG:
+                debug_log(f"Raw response: {raw_text[:300]}...")
             
-            # Extract the message content
-            raw_text = result.get("choices", [{}])[0].get("message", {}).get("content", "")
-            debug_log(f"Raw response: {raw_text[:300]}...")
+            if finish_reason == "length":
+                # Cut off at max_tokens - whatever parses out of it is incomplete
+                error_msg = f"Reply cut off at {max_tokens} tokens"
+                self.last_error = error_msg
+                debug_log(f"API error: {error_msg}")
+                return LLMResponse(
+                    success=False,
+                    content=None,
+                    raw_text=raw_text,
+                    error=error_msg,
+                    model_used=model,
+                    status=status,
+                    finish_reason=finish_reason
+                )
             
             # Try to parse as JSON
             content = self._parse_json_response(raw_text)
@@ -417,12 +729,12 @@ class OpenRouterClient:
                 content=content,
                 raw_text=raw_text,
                 error=None,
-                model_used=self.model
+                model_used=model,
+                status=status
             )
             
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode("utf-8") if e.fp else ""
-            error_msg = f"HTTP {e.code}: {error_body[:200]}"
+        except (http.client.HTTPException, OSError) as e:
+            error_msg = f"Connection error: {e}"
             self.last_error = error_msg
             debug_log(f"API error: {error_msg}")
             return LLMResponse(
@@ -430,11 +742,11 @@ class OpenRouterClient:
                 content=None,
                 raw_text="",
                 error=error_msg,
-                model_used=self.model
+                model_used=model
             )
             
-        except urllib.error.URLError as e:
-            error_msg = f"Connection error: {e.reason}"
+        except Exception as e:
+            error_msg = f"Unexpected error: {str(e)}"
             self.last_error = error_msg
             debug_log(f"API error: {error_msg}")
             return LLMResponse(
@@ -442,52 +754,244 @@ class OpenRouterClient:
                 content=None,
                 raw_text="",
                 error=error_msg,
-                model_used=self.model
+                model_used=model
             )
-            
-        except Exception as e:
-            error_msg = f"Unexpected error: {str(e)}"
-            self.last_error = error_msg
-            debug_log(f"API error: {error_msg}")
+    
+    def call_local(self, system_prompt: str, user_prompt: str,
+                   temperature: float = 0.8, max_tokens: int = 1000,
+                   timeout: int = 60) -> LLMResponse:
+        """
+        Make the same call against the local model server at LOCAL_MODEL_URL.
+        Not streamed; a fresh connection per call is cheap on localhost.
+        Returns LLMResponse with parsed JSON content if possible.
+        """
+        url = urlsplit(LOCAL_MODEL_URL)
+        connection_class = http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+        payload = {
+            "model": LOCAL_MODEL,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "response_format": {"type": "json_object"}
+        }
+        
+        conn = connection_class(url.hostname, url.port, timeout=timeout)
+        try:
+            conn.request("POST", url.path or "/", body=encode_json(payload),
+                         headers={"Content-Type": "application/json"})
+            response = conn.getresponse()
+            status, body = response.status, response.read()
+        except (http.client.HTTPException, OSError) as e:
+            debug_log(f"Local model error: {e}")
             return LLMResponse(
                 success=False,
                 content=None,
                 raw_text="",
-                error=error_msg,
-                model_used=self.model
+                error=f"Local model error: {e}",
+                model_used=LOCAL_MODEL
+            )
+        finally:
+            conn.close()
+        
+        if status >= 400:
+            return LLMResponse(
+                success=False,
+                content=None,
+                raw_text="",
+                error=f"HTTP {status}: {body.decode('utf-8', 'replace')[:200]}",
+                model_used=LOCAL_MODEL,
+                status=status
             )
+        
+        try:
+            raw_text = decode_json(body)["choices"][0]["message"]["content"] or ""
+        except (ValueError, KeyError, IndexError, TypeError):
+            raw_text = ""
+        
+        return LLMResponse(
+            success=True,
+            content=self._parse_json_response(raw_text),
+            raw_text=raw_text,
+            error=None,
+            model_used=LOCAL_MODEL,
+            status=status
+        )
+    
+    def _send(self, data: bytes, headers: dict, timeout: int = 30) -> http.client.HTTPResponse:
+        """
+        POST a request body over this thread's keep-alive connection.
+        Returns the response with its body unread. Retries once if a reused
+        connection was closed by the server while idle.
+        """
+        for attempt in range(2):
+            conn = _get_connection(timeout)
+            try:
+                conn.request("POST", _API_URL.path, body=data, headers=headers)
+                return conn.getresponse()
+            except TimeoutError:
+                _drop_connection()
+                raise
+            except (http.client.HTTPException, OSError):
+                _drop_connection()
+                if attempt:
+                    raise
+    
+    def _post(self, data: bytes, headers: dict, timeout: int = 30) -> tuple:
+        """POST and read the whole reply. Returns (status, body bytes)."""
+        response = self._send(data, headers, timeout)
+        try:
+            return response.status, response.read()
+        except (http.client.HTTPException, OSError):
+            _drop_connection()
+            raise
+    
+    def _post_stream(self, data: bytes, headers: dict, on_delta: Callable[[str], None],
+                     timeout: int = 30) -> tuple:
+        """
+        POST a streaming request and read the server-sent events as they arrive,
+        passing each content fragment to on_delta.
+        Returns (status, error body bytes, full text, finish reason) - the text is
+        None on HTTP errors.
+        """
+        response = self._send(data, headers, timeout)
+        try:
+            if response.status >= 400:
+                return response.status, response.read(), None, ""
+            parts = []
+            finish_reason = ""
+            for line in response:
+                if not line.startswith(b"data:"):
+                    continue  # Blank separators and ": keep-alive" comments
+                event = line[5:].strip()
+                if event == b"[DONE]":
+                    break
+                chunk = decode_json(event)
+                if "error" in chunk:
+                    raise http.client.HTTPException(f"stream error: {chunk['error']}")
+                choice = chunk.get("choices", [{}])[0]
+                delta = choice.get("delta", {}).get("content")
+                if delta:
+                    parts.append(delta)
+                    on_delta(delta)
+                finish_reason = choice.get("finish_reason") or finish_reason
+            response.read()  # Drain the terminating chunk so the connection can be reused
+            return response.status, b"", "".join(parts), finish_reason
+        except (http.client.HTTPException, OSError, ValueError):
+            _drop_connection()
+            raise
     
     def _parse_json_response(self, text: str) -> Optional[dict]:
         """Extract and parse JSON from LLM response."""
-        # First try direct parse
-        try:
-            return json.loads(text)
-        except json.JSONDecodeError:
-            pass
-        
-        # Try to find JSON in markdown code blocks
-        import re
-        patterns = [
-            r"```json\s*(.*?)\s*```",
-            r"```\s*(.*?)\s*```",
-            r"\{.*\}"
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.DOTALL)
-            for match in matches:
-                try:
-                    # Clean up the match
-                    clean = match.strip()
-                    if not clean.startswith("{"):
-                        continue
-                    return json.loads(clean)
-                except json.JSONDecodeError:
-                    continue
+        # Drop a leading markdown fence, then decode the object that starts at the
+        # first brace. A truncated reply must fail here rather than fall through
+        # to a nested object, which would be cached as a success
+        text = text.strip()
+        if text.startswith("```"):
+            text = text[text.find("\n") + 1:]
+        start = text.find("{")
+        if start != -1:
+            try:
+                data = JSON_DECODER.raw_decode(text, start)[0]
+                if isinstance(data, dict):
+                    return data
+            except json.JSONDecodeError:
+                pass
         
         debug_log("Failed to parse JSON from response")
         return None
 
+def encode_json(data: Any, sort_keys: bool = False) -> bytes:
+    """Encode compact JSON bytes (orjson when available); unknown types become strings."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(data, default=str, option=option)
+    return json.dumps(data, sort_keys=sort_keys, default=str).encode("utf-8")
+
+def decode_json(raw) -> Any:
+    """Decode JSON from bytes or str (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# Finds a JSON object embedded in surrounding text (raw_decode stops at its end)
+JSON_DECODER = json.JSONDecoder()
+
+# JSON string escapes that decode to a single character
+JSON_ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+JSON_PLAIN_RUN = re.compile(r'[^"\\]+')
+
+class JsonFieldStream:
+    """
+    Pull one string field out of a JSON reply while it is still streaming,
+    passing the decoded text to on_text fragment by fragment.
+    """
+    
+    def __init__(self, field: str, on_text: Callable[[str], None]):
+        self.on_text = on_text
+        self.done = False
+        self._start = re.compile(r'"%s"\s*:\s*"' % re.escape(field))
+        self._seen = ""      # Reply text before the field's value starts
+        self._pending = ""   # Escape sequence split across fragments
+        self._in_value = False
+    
+    def feed(self, fragment: str) -> None:
+        """Consume the next fragment of the raw reply."""
+        if self.done:
+            return
+        if not self._in_value:
+            self._seen += fragment
+            match = self._start.search(self._seen)
+            if not match:
+                return
+            fragment = self._seen[match.end():]
+            self._seen = ""
+            self._in_value = True
+        
+        text = self._pending + fragment
+        self._pending = ""
+        out = []
+        i, end = 0, len(text)
+        while i < end:
+            char = text[i]
+            if char == '"':
+                self.done = True
+                break
+            if char != "\\":
+                run = JSON_PLAIN_RUN.match(text, i)
+                out.append(run.group())
+                i = run.end()
+                continue
+            # Escape sequence - wait for the rest if it was cut off
+            if i + 1 >= end:
+                self._pending = text[i:]
+                break
+            if text[i + 1] != "u":
+                out.append(JSON_ESCAPES.get(text[i + 1], text[i + 1]))
+                i += 2
+                continue
+            try:
+                code = int(text[i + 2:i + 6], 16) if i + 6 <= end else None
+                if code is not None and 0xD800 <= code < 0xDC00:  # Surrogate pair
+                    low = int(text[i + 8:i + 12], 16) if i + 12 <= end else None
+                    code = None if low is None else 0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)
+                    width = 12
+                else:
+                    width = 6
+            except ValueError:
+                self.done = True  # Not valid JSON - let the full parse sort it out
+                break
+            if code is None:
+                self._pending = text[i:]
+                break
+            out.append(chr(code))
+            i += width
+        
+        if out:
+            self.on_text("".join(out))
+
 # =============================================================================
 # DUNGEON MASTER CLASS
 # =============================================================================
@@ -502,6 +1006,7 @@ class DungeonMaster:
         self.client = OpenRouterClient(api_key, model)
         self.retry_count = 2
         self.fallback_enabled = True
+        self.draft_model = DRAFT_MODEL
     
     def is_ready(self) -> bool:
         """Check if the DM is ready to run (API configured)."""
@@ -515,25 +1020,97 @@ class DungeonMaster:
         """Get current model."""
         return self.client.model
     
+    def _cache_digest(self, cache_key: tuple) -> str:
+        """Stable fingerprint of a cache key (model included - each model writes differently)."""
+        return hashlib.blake2b(encode_json([self.client.model, *cache_key], sort_keys=True),
+                               digest_size=16).hexdigest()
+    
+    def _remember(self, digest: Optional[str], content: dict) -> None:
+        """Store a successful response in the shared cache (no-op for uncached calls)."""
+        if digest is None:
+            return
+        with _response_cache_lock:
+            _response_cache[digest] = copy.deepcopy(content)
+            if len(_response_cache) > RESPONSE_CACHE_SIZE:
+                _response_cache.popitem(last=False)
+    
+    def _should_draft(self) -> bool:
+        """Drafting only pays off when the draft model is cheaper than the selected one."""
+        if not self.draft_model or self.draft_model == self.client.model:
+            return False
+        return AVAILABLE_MODELS.get(self.client.model, {}).get("tier") != "cheap"
+    
     def _call_with_retry(self, system: str, prompt: str, 
-                         fallback: Optional[dict] = None) -> tuple[bool, dict, Optional[str]]:
+                         fallback: Optional[dict] = None,
+                         cache_key: Optional[tuple] = None,
+                         draft_check: Optional[Callable[[dict], bool]] = None,
+                         on_delta: Optional[Callable[[str], None]] = None,
+                         schema: Optional[dict] = None,
+                         max_tokens: int = 1000) -> tuple[bool, dict, Optional[str]]:
         """
         Call the API with retries.
+        With a cache_key, a successful response is remembered and repeat keys skip the API.
+        With a draft_check, the draft model answers first and is kept if the check passes.
+        With on_delta, the first call (the draft, if any) is streamed through it.
+        A schema constrains the reply format on models that support it.
+        max_tokens caps the reply length (see MAX_TOKENS).
         Returns (success, content, error_message)
         """
+        digest = None
+        if cache_key is not None:
+            digest = self._cache_digest(cache_key)
+            with _response_cache_lock:
+                cached = _response_cache.get(digest)
+                if cached is not None:
+                    _response_cache.move_to_end(digest)
+            if cached is not None:
+                debug_log(f"Cache hit: {cache_key[0]}")
+                # Callers add to the content (e.g. a rest choice), so hand out a copy
+                return True, copy.deepcopy(cached), None
+        
+        if draft_check is not None and self._should_draft():
+            draft = self.client.call(system, prompt, max_tokens=max_tokens, model=self.draft_model,
+                                     on_delta=on_delta, schema=schema)
+            if draft.success and draft.content and draft_check(draft.content):
+                self._remember(digest, draft.content)
+                return True, draft.content, None
+            debug_log(f"Draft from {self.draft_model} deferred to {self.client.model}")
+            # The caller already saw the draft stream; it redraws from the final result
+            on_delta = None
+        
         for attempt in range(self.retry_count + 1):
-            response = self.client.call(system, prompt)
+            response = self.client.call(system, prompt, max_tokens=max_tokens,
+                                        on_delta=on_delta if attempt == 0 else None, schema=schema)
             
             if response.success and response.content:
+                self._remember(digest, response.content)
                 return True, response.content, None
             
-            if attempt < self.retry_count:
-                debug_log(f"Retry {attempt + 1}/{self.retry_count}")
+            if (attempt == self.retry_count or response.status in NON_RETRYABLE_STATUS
+                    or not self.client.is_configured()):
+                break
+            if response.status == 400:
+                if schema is None:
+                    break  # The request itself is bad - resending it won't help
+                schema = None  # Provider rejected the schema - retry as plain JSON
+            elif response.finish_reason == "length":
+                max_tokens *= 2  # Ran out of room (e.g. reasoning tokens) - give it more
+            elif response.status == 429 or response.status >= 500 or not response.success:
+                # Rate limited, server error or no response - back off before retrying
+                time.sleep(random.uniform(0, RETRY_BACKOFF * 2 ** attempt))
+            
+            debug_log(f"Retry {attempt + 1}/{self.retry_count}")
+        
+        # All retries failed - a local model still beats the canned fallback
+        if LOCAL_MODEL_URL:
+            local = self.client.call_local(system, prompt, max_tokens=max_tokens)
+            if local.success and local.content:
+                debug_log(f"Using local model {LOCAL_MODEL}")
+                return True, local.content, None
         
-        # All retries failed
         if self.fallback_enabled and fallback:
             debug_log("Using fallback content")
-            return False, fallback, response.error
+            return False, copy.deepcopy(fallback), response.error
         
         return False, {}, response.error
     
@@ -554,26 +1131,10 @@ class DungeonMaster:
                 f"The tavern is half-empty tonight. A worried-looking bartender polishes glasses. "
                 f"In the corner, a hooded figure nurses a drink. On the notice board, you spot a weathered poster."
             ),
-            "location_name": "The Rusty Tankard",
-            "main_quest_hook": {
-                "id": "main_quest",
-                "name": "The Missing Villagers",
-                "description": "Villagers have been disappearing near the old mill",
-                "rumors": ["Strange lights at night", "No bodies ever found"]
-            },
-            "npcs_present": [
-                {"name": "Gruff Bartender", "role": "bartender", "appearance": "tired, worried eyes"},
-                {"name": "Hooded Stranger", "role": "stranger", "appearance": "face hidden, watching"}
-            ],
-            "choices": [
-                {"id": 1, "text": "Talk to the bartender about the troubles", "type": "talk"},
-                {"id": 2, "text": "Approach the hooded stranger", "type": "talk"},
-                {"id": 3, "text": "Check the notice board", "type": "quest"},
-                {"id": 4, "text": "Order a drink and listen to conversations", "type": "explore"}
-            ]
+            **OPENING_FALLBACK
         }
         
-        return self._call_with_retry(SYSTEM_PROMPT, prompt, fallback)
+        return self._call_with_retry(SYSTEM_PROMPT, prompt, fallback, max_tokens=MAX_TOKENS["story_start"])
     
     def generate_location(self, location_type: str, player_name: str, player_class: str,
                          hp: int, max_hp: int, gold: int, inventory: list,
@@ -587,34 +1148,39 @@ class DungeonMaster:
             hp=hp,
             max_hp=max_hp,
             gold=gold,
-            inventory=", ".join(inventory[:5]) if inventory else "nothing notable",
+            inventory=summarize_inventory(inventory),
             active_quest=active_quest or "none",
-            story_summary=story_summary or "The adventure begins...",
-            world_flags=json.dumps(world_flags) if world_flags else "{}"
+            story_summary=trim_story_context(story_summary) or "The adventure begins...",
+            world_flags=summarize_flags(world_flags)
         )
         
         fallback = {
             "location_name": location_type.replace("_", " ").title(),
             "description": f"You find yourself in {location_type.replace('_', ' ')}. The air is thick with mystery and potential danger.",
-            "choices": [
-                {"id": 1, "text": "Look around carefully", "type": "explore"},
-                {"id": 2, "text": "Move forward cautiously", "type": "explore"},
-                {"id": 3, "text": "Search for useful items", "type": "explore"},
-                {"id": 4, "text": "Rest for a moment", "type": "rest"}
-            ],
+            "choices": FALLBACK_CHOICES,
             "requires_check": None,
             "hidden_info": None,
             "possible_encounter": {"chance": 0.2, "enemy_type": "wandering creature"}
         }
         
-        return self._call_with_retry(SYSTEM_PROMPT, prompt, fallback)
+        # Only what shapes the scene - HP and gold drift every turn and would defeat the cache
+        last_event = trim_story_context(story_summary.rpartition(" | ")[2]) if story_summary else ""
+        cache_key = ("location", normalize_key_text(location_type), player_name, player_class,
+                     active_quest, world_flags, normalize_key_text(last_event))
+        return self._call_with_retry(SYSTEM_PROMPT, prompt, fallback, cache_key, schema=LOCATION_SCHEMA,
+                                     max_tokens=MAX_TOKENS["location"])
     
     def generate_choice_result(self, location_name: str, player_name: str, player_class: str,
                                hp: int, max_hp: int, gold: int, inventory: list,
                                active_quest: Optional[str], story_summary: str,
                                choice_text: str, choice_type: str,
-                               skill_check_result: str = "") -> tuple[bool, dict, Optional[str]]:
-        """Generate the result of a player's choice."""
+                               skill_check_result: str = "",
+                               on_narration: Optional[Callable[[str], None]] = None) -> tuple[bool, dict, Optional[str]]:
+        """
+        Generate the result of a player's choice.
+        on_narration, if given, receives the narration text as it streams in (only
+        when it comes from a live call - cached and drafted results arrive whole).
+        """
         prompt = CHOICE_RESULT_PROMPT.format(
             location_name=location_name,
             player_name=player_name,
@@ -622,9 +1188,9 @@ class DungeonMaster:
             hp=hp,
             max_hp=max_hp,
             gold=gold,
-            inventory=", ".join(inventory[:5]) if inventory else "nothing notable",
+            inventory=summarize_inventory(inventory),
             active_quest=active_quest or "none",
-            story_summary=story_summary or "The adventure continues...",
+            story_summary=trim_story_context(story_summary) or "The adventure continues...",
             choice_text=choice_text,
             choice_type=choice_type,
             skill_check_result=f"\nSKILL CHECK: {skill_check_result}" if skill_check_result else ""
@@ -640,10 +1206,17 @@ class DungeonMaster:
             "quest_update": None,
             "flag_changes": {},
             "requires_another_check": None,
-            "follow_up_choices": None
+            "follow_up_choices": FALLBACK_CHOICES
         }
         
-        return self._call_with_retry(SYSTEM_PROMPT, prompt, fallback)
+        cache_key = ("choice_result", location_name, player_name, player_class, hp, max_hp, gold,
+                     inventory, active_quest, story_summary, choice_text, choice_type, skill_check_result)
+        # Fights and failed checks are plot-critical - those always go to the selected model
+        routine = choice_type not in ("combat", "skill_check") and "FAILURE" not in skill_check_result
+        draft_check = is_acceptable_draft if routine else None
+        on_delta = JsonFieldStream("narration", on_narration).feed if on_narration else None
+        return self._call_with_retry(SYSTEM_PROMPT, prompt, fallback, cache_key, draft_check, on_delta,
+                                     CHOICE_RESULT_SCHEMA, MAX_TOKENS["choice_result"])
     
     def generate_combat_narration(self, player_name: str, player_class: str,
                                   hp: int, max_hp: int,
@@ -674,7 +1247,14 @@ class DungeonMaster:
             "tactical_hint": None
         }
         
-        return self._call_with_retry(SYSTEM_PROMPT, prompt, fallback)
+        bucket = NARRATION_HP_BUCKET
+        cache_key = ("combat_narration", player_name, player_class, round(hp / bucket), max_hp,
+                     enemy_name, round(enemy_hp / bucket), enemy_max_hp, turn_number,
+                     normalize_key_text(player_action), player_result,
+                     normalize_key_text(enemy_action), enemy_result)
+        # A line or two of prose - with DM_DRAFT_MODEL set, the draft model tries it first
+        return self._call_with_retry(SYSTEM_PROMPT, prompt, fallback, cache_key, is_acceptable_narration,
+                                     max_tokens=MAX_TOKENS["combat_narration"])
     
     def generate_enemy(self, location_type: str, player_power: int,
                        situation: str, story_summary: str) -> tuple[bool, dict, Optional[str]]:
@@ -683,7 +1263,7 @@ class DungeonMaster:
             location_type=location_type,
             player_power=player_power,
             situation=situation,
-            story_summary=story_summary or "An adventure in progress"
+            story_summary=trim_story_context(story_summary) or "An adventure in progress"
         )
         
         # Scale fallback based on power level
@@ -702,7 +1282,12 @@ class DungeonMaster:
             "loot": []
         }
         
-        return self._call_with_retry(SYSTEM_PROMPT, prompt, fallback)
+        # Keyed on the story context the prompt actually sees, not the untrimmed events
+        cache_key = ("enemy", normalize_key_text(location_type), player_power,
+                     normalize_key_text(situation), normalize_key_text(trim_story_context(story_summary)))
+        # With DM_DRAFT_MODEL set, a well-formed draft is kept (stats are clamped on our side)
+        return self._call_with_retry(SYSTEM_PROMPT, prompt, fallback, cache_key, is_acceptable_enemy,
+                                     max_tokens=MAX_TOKENS["enemy"])
     
     def generate_ending(self, player_name: str, player_class: str,
                         hp: int, max_hp: int, gold: int,
@@ -731,12 +1316,100 @@ class DungeonMaster:
             "credits_note": "Thanks for playing!"
         }
         
-        return self._call_with_retry(SYSTEM_PROMPT, prompt, fallback)
+        cache_key = ("ending", player_name, player_class, hp, max_hp, gold,
+                     achievements, quests, major_choices, ending_type)
+        return self._call_with_retry(SYSTEM_PROMPT, prompt, fallback, cache_key,
+                                     max_tokens=MAX_TOKENS["ending"])
 
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
+def summarize_inventory(inventory: list) -> str:
+    """Inventory for a prompt: duplicates counted, capped at CONTEXT_INVENTORY_ITEMS entries."""
+    if not inventory:
+        return "nothing notable"
+    counts = Counter(inventory)
+    parts = [f"{count}x {item}" if count > 1 else item
+             for item, count in islice(counts.items(), CONTEXT_INVENTORY_ITEMS)]
+    if len(counts) > CONTEXT_INVENTORY_ITEMS:
+        parts.append(f"{len(counts) - CONTEXT_INVENTORY_ITEMS} more")
+    return ", ".join(parts)
+
+def summarize_flags(world_flags: dict) -> str:
+    """The most recently set world flags: bare names for true flags, name=value otherwise."""
+    if not world_flags:
+        return "none"
+    recent = islice(world_flags.items(), max(0, len(world_flags) - CONTEXT_FLAG_COUNT), None)
+    return ", ".join(
+        name if value is True else f"{name}={json.dumps(value, separators=(',', ':'), default=str)}"
+        for name, value in recent
+    )
+
+def trim_story_context(story_summary: str) -> str:
+    """Cut each " | "-joined story event to CONTEXT_EVENT_CHARS."""
+    if not story_summary:
+        return story_summary
+    return " | ".join(
+        event if len(event) <= CONTEXT_EVENT_CHARS else event[:CONTEXT_EVENT_CHARS - 3] + "..."
+        for event in story_summary.split(" | ")
+    )
+
+KEY_WORDS = re.compile(r"\w+")
+
+def normalize_key_text(text: Optional[str]) -> str:
+    """Free text reduced to lowercase words, so wording that differs only in case,
+    spacing or punctuation shares a response cache entry."""
+    return " ".join(KEY_WORDS.findall(text.casefold())) if text else ""
+
+CHOICE_TYPES = frozenset(_CHOICE_ITEM["properties"]["type"]["enum"])
+
+def is_complete_text(text: Any, min_length: int) -> bool:
+    """Prose of at least min_length characters that ends a sentence (not cut off)."""
+    return isinstance(text, str) and len(text) >= min_length and text.rstrip()[-1:] in ".!?\"'"
+
+def is_acceptable_draft(content: dict) -> bool:
+    """Quality check for a drafted choice result: full narration, sane shape, usable choices."""
+    choices = content.get("follow_up_choices")
+    triggers_combat = content.get("triggers_combat", False)
+    return (
+        is_complete_text(content.get("narration"), 80)
+        and isinstance(triggers_combat, bool)
+        and (not triggers_combat or isinstance(content.get("enemy"), dict))
+        and isinstance(content.get("items_found", []), list)
+        and isinstance(content.get("gold_found", 0), int)
+        and isinstance(choices, list) and 3 <= len(choices) <= 5
+        and all(
+            isinstance(c, dict) and isinstance(c.get("text"), str) and c["text"].strip()
+            and c.get("type") in CHOICE_TYPES
+            for c in choices
+        )
+        and len({c.get("id") for c in choices}) == len(choices)
+    )
+
+COMBAT_STATUSES = frozenset({"fighting", "wounded", "desperate", "victorious", "defeated"})
+
+def is_acceptable_narration(content: dict) -> bool:
+    """Quality check for drafted combat narration: a finished sentence and known statuses."""
+    return (
+        is_complete_text(content.get("narration"), 40)
+        and content.get("player_status", "fighting") in COMBAT_STATUSES
+        and content.get("enemy_status", "fighting") in COMBAT_STATUSES
+    )
+
+def is_acceptable_enemy(content: dict) -> bool:
+    """Quality check for a drafted enemy: named, described, with usable combat stats."""
+    name = content.get("name")
+    dice = content.get("damage_dice")
+    return (
+        isinstance(name, str) and bool(name.strip())
+        and is_complete_text(content.get("description"), 20)
+        and all(isinstance(content.get(stat), int) for stat in ("hp", "ac", "attack_bonus"))
+        and content["hp"] > 0
+        and isinstance(dice, list) and len(dice) == 2
+        and all(isinstance(d, int) and d > 0 for d in dice)
+    )
+
 def list_available_models() -> list[tuple[str, str, str]]:
     """Return list of (model_id, name, description) tuples."""
     return [
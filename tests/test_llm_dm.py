@@ -0,0 +1,34 @@
+"""Tests for parsing DM replies in llm_dm."""
+
+import unittest
+
+from llm_dm import OpenRouterClient
+
+
+class ParseJsonResponseTest(unittest.TestCase):
+    def setUp(self):
+        self.client = OpenRouterClient(api_key="test")
+
+    def test_plain_object(self):
+        self.assertEqual(self.client._parse_json_response('{"hp": 7}'), {"hp": 7})
+
+    def test_fenced_object(self):
+        text = '```json\n{"enemy": {"name": "Goblin"}}\n```'
+        self.assertEqual(self.client._parse_json_response(text),
+                         {"enemy": {"name": "Goblin"}})
+
+    def test_prose_around_object(self):
+        text = 'Here you go:\n{"gold": 3}\nEnjoy!'
+        self.assertEqual(self.client._parse_json_response(text), {"gold": 3})
+
+    def test_truncated_reply_does_not_return_nested_object(self):
+        text = ('```json\n{"narration": "A goblin leaps out", '
+                '"enemy": {"name": "Goblin", "hp": 7, "ac": 12}, "choices": [')
+        self.assertIsNone(self.client._parse_json_response(text))
+
+    def test_non_object_is_rejected(self):
+        self.assertIsNone(self.client._parse_json_response('[1, 2, 3]'))
+
+
+if __name__ == "__main__":
+    unittest.main()